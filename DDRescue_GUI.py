@@ -34,6 +34,8 @@ This is the main script that you use to start DDRescue-GUI.
 from distutils.version import LooseVersion
 
 import threading
+import asyncio
+import codecs
 import getopt
 import logging
 import time
@@ -70,6 +72,9 @@ APPICON = None
 SETTINGS = {}
 DISKINFO = {}
 
+#Translation table used to remove newlines and carriage returns from ddrescue's output.
+LINE_ENDINGS_TABLE = str.maketrans("", "", "\n\r")
+
 def usage():
     """
     Outputs information on cmdline options for the user.
@@ -708,9 +713,11 @@ class MainWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,too-ma
         SETTINGS["InputFile"] = None
         SETTINGS["OutputFile"] = None
         SETTINGS["MapFile"] = None
-        SETTINGS["RecoveringData"] = False
         SETTINGS["CheckedSettings"] = False
 
+        #Set while a recovery is running. This is shared between threads, so use an Event.
+        SETTINGS["RecoveringData"] = threading.Event()
+
         #DDRescue's options.
         SETTINGS["DirectAccess"] = "-d"
         SETTINGS["OverwriteOutputFile"] = ""
@@ -1882,7 +1889,7 @@ class MainWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,too-ma
         Call self.on_start() otherwise.
         """
 
-        if SETTINGS["RecoveringData"]:
+        if SETTINGS["RecoveringData"].is_set():
             self.on_abort()
 
         else:
@@ -2098,6 +2105,31 @@ class MainWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,too-ma
             self.update_status_bar("Ready.")
 
     #The next functions are to update the display with info from the backend.
+    def apply_updates(self, updates):
+        """
+        Apply a batch of updates from the backend thread.
+
+        Args:
+            updates (dict).             The new values, keyed by name. Each
+                                        name corresponds to one of the
+                                        update_* methods below, apart from
+                                        "progress_bar_range" and
+                                        "output_box".
+        """
+
+        for name, value in updates.items():
+            if name == "progress_bar_range":
+                self.set_progress_bar_range(value)
+
+            elif name == "output_box":
+                self.output_box.update(value)
+
+            elif name == "progress":
+                self.update_progress(*value)
+
+            else:
+                getattr(self, "update_"+name)(value)
+
     def set_progress_bar_range(self, _range):
         """
         Set the progress bar's range.
@@ -2243,8 +2275,15 @@ class MainWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,too-ma
             CoreTools.start_process("killall -s INT ddrescue",
                                     privileged=True)
 
-        elif CYGWIN:
-            DDRESCUE_CMD.send_signal(signal.SIGINT)
+        elif CYGWIN and DDRESCUE_CMD is not None:
+            #Signal ddrescue by its pid, rather than through the process object,
+            #because that belongs to the backend thread's event loop.
+            try:
+                os.kill(DDRESCUE_CMD.pid, signal.SIGINT)
+
+            except ProcessLookupError:
+                #ddrescue has already exited.
+                pass
 
         else:
             CoreTools.start_process("killall -INT ddrescue",
@@ -2269,7 +2308,7 @@ class MainWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,too-ma
         taking a very long time to timeout/fail a read operation.
         """
         #If we're still recovering data, prompt the user to try killing ddrescue again.
-        if SETTINGS["RecoveringData"]:
+        if SETTINGS["RecoveringData"].is_set():
             logger.warning("MainWindow().prompt_to_kill_ddrescue(): ddrescue is still running 5 "
                            "seconds after attempted abort! Asking user whether to wait or try "
                            "stop it again...")
@@ -2486,7 +2525,7 @@ class MainWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,too-ma
         logging.warning("MainWindow().on_session_end(): Attempting to veto system shutdown / "
                         "logoff...")
 
-        if event.CanVeto() and SETTINGS["RecoveringData"]:
+        if event.CanVeto() and SETTINGS["RecoveringData"].is_set():
             #Veto the shutdown and warn the user.
             event.Veto(True)
             logging.info("MainWindow().on_session_end(): Vetoed system shutdown / logoff...")
@@ -2532,7 +2571,7 @@ class MainWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,too-ma
             self.Destroy()
 
         #Check if DDRescue-GUI is recovering data.
-        if SETTINGS["RecoveringData"]:
+        if SETTINGS["RecoveringData"].is_set():
             logger.error("MainWindow().on_exit(): Can't exit while recovering data! Aborting exit "
                          "attempt...")
 
@@ -2709,7 +2748,7 @@ class DiskInfoWindow(wx.Frame): #pylint: disable=too-many-ancestors
         self.refresh_button = wx.Button(self.panel, -1, "Refresh")
 
         #Disable the refresh button if we're recovering data.
-        if SETTINGS["RecoveringData"]:
+        if SETTINGS["RecoveringData"].is_set():
             self.refresh_button.Disable()
 
         #Create the animation for the throbber.
@@ -3612,63 +3651,6 @@ class FinishedWindow(wx.Frame): #pylint: disable=too-many-instance-attributes,to
         self.Bind(wx.EVT_CLOSE, self.on_exit)
 
 #End Finished Window
-#Begin Elapsed Time Thread.
-class ElapsedTimeThread(threading.Thread):
-    """
-    Keeps track of elapsed time during a recovery.
-    A separate thread is used for this because
-    wx.Timer wasn't working on macOS, and the
-    BackendThread blocks if ddrescue pauses.
-    """
-
-    def __init__(self, parent):
-        """
-        Initialize and start the thread.
-
-        Args:
-            parent (object).                The parent window that started this
-                                            window."""
-        self.parent = parent
-
-        #This starts a little after ddrescue, so start at 2 seconds.
-        self.runtime_secs = 2
-
-        threading.Thread.__init__(self)
-        self.start()
-
-    def run(self):
-        """
-        Main body of the thread, started with self.start().
-        """
-        while SETTINGS["RecoveringData"]:
-            #Elapsed time.
-            self.runtime_secs += 1
-
-            #Convert between Seconds, Minutes, Hours, and Days to make the value as
-            #understandable as possible.
-            if self.runtime_secs <= 60:
-                run_time = self.runtime_secs
-                unit = " seconds"
-
-            elif self.runtime_secs >= 60 and self.runtime_secs <= 3600:
-                run_time = self.runtime_secs//60
-                unit = " minutes"
-
-            elif self.runtime_secs > 3600 and self.runtime_secs <= 86400:
-                run_time = round(self.runtime_secs/3600, 2)
-                unit = " hours"
-
-            elif self.runtime_secs > 86400:
-                run_time = round(self.runtime_secs/86400, 2)
-                unit = " days"
-
-            #Update the text.
-            wx.CallAfter(self.parent.update_time_elapsed, "Time Elapsed: "+str(run_time)+unit)
-
-            #Wait for a second.
-            time.sleep(1)
-
-#End Elapsed Time Thread
 #Begin Backend Thread
 class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attributes
     """
@@ -3687,7 +3669,6 @@ class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attrib
 
         #Set the below values to sensible defaults to prevent errors if we never get
         #any info from ddrescue.
-        self.old_status = ""
         self.got_initial_status = False
         self.input_pos = "0 B"
         self.disk_capacity = "An unknown amount of"
@@ -3705,6 +3686,52 @@ class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attrib
         self.num_errors = None
         self.output_pos = None
 
+        #Updates for the GUI thread, which are sent together once each line has been processed.
+        self.pending_updates = {}
+
+        #The last value sent to the GUI thread for each update, so we can skip updates that
+        #wouldn't change anything. Most values stay the same between lines.
+        self.last_updates = {"status_bar": ""}
+
+        #The last line of output, and the text we prepared for the output box from it.
+        self.last_output_line = None
+        self.output_box_line = ""
+
+        #Keeps track of the time elapsed. This is started when we get ddrescue's initial status.
+        self.start_time = None
+        self.runtime_secs = 0
+
+        #Work out the minor version of ddrescue once, rather than for every line of output.
+        self.ddrescue_minor_version = int(SETTINGS["DDRescueVersion"].split(".")[1])
+
+        #Work out which method handles each line of ddrescue's output, by the first word
+        #on the line. Some lines are only handled this way on certain versions of ddrescue.
+        self.line_handlers = {"About": self.handle_initial_status,
+                              "non-tried:": self.handle_unreadable_data,
+                              "time": self.handle_time_since_last_read,
+                              "percent": self.handle_time_since_last_read}
+
+        #Pick the handlers for this version of ddrescue now, so we don't have to check the
+        #version for every line of output.
+        if self.ddrescue_minor_version < 20:
+            self.line_handlers["ipos:"] = self.handle_input_pos
+            self.line_handlers["opos:"] = self.handle_output_pos_1_14
+            self.status_line_marker = "rescued:"
+            self.handle_status_info = self.handle_status_info_1_14
+
+        elif self.ddrescue_minor_version == 20:
+            self.line_handlers["ipos:"] = self.handle_input_pos
+            self.line_handlers["opos:"] = self.handle_output_pos_1_20
+            self.status_line_marker = "rescued:"
+            self.handle_status_info = self.handle_status_info_1_20
+
+        else:
+            self.line_handlers["rescued:"] = self.handle_recovered_data
+            self.line_handlers["pct"] = self.handle_time_remaining
+            self.line_handlers["opos:"] = self.handle_output_pos_1_21
+            self.status_line_marker = "ipos:"
+            self.handle_status_info = self.handle_status_info_1_21
+
         threading.Thread.__init__(self)
         self.start()
 
@@ -3717,9 +3744,10 @@ class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attrib
         #Find suitable functions.
         suitable_functions = DDRescueTools.setup_for_ddrescue_version(SETTINGS["DDRescueVersion"])
 
-        #Define all of these functions here under their correct names.
+        #Define all of these functions here under their correct names. Put them on the
+        #class rather than the instance, so they're found like normal methods.
         for function in suitable_functions:
-            vars(self)[function.__name__] = function
+            setattr(type(self), function.__name__, staticmethod(function))
 
         #Prepare to start ddrescue.
         logger.debug("MainBackendThread(): Preparing to start ddrescue...")
@@ -3739,89 +3767,37 @@ class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attrib
         else:
             exec_list = ["sudo", "-SH", RESOURCEPATH+"/ddrescue", "-v"]
 
-        for option in options_list:
-            #Handle direct disk access on OS X.
-            if LINUX is False and options_list.index(option) == 0 and option != "":
-                #If we're recovering from a file, don't enable direct disk access (it won't work).
-                if SETTINGS["InputFile"][0:5] != "/dev/":
-                    #Make sure "-d" isn't added to the exec_list if this is a file we're reading
-                    #from. It doesn't work on macOS.
-                    #(continue to next iteration of loop w/o adding).
-                    continue
+        #Handle direct disk access on OS X. "-d" doesn't work on macOS, so it is never passed
+        #to ddrescue there. Instead, when recovering from a device, use the raw device
+        #(/dev/rdisk) instead of /dev/disk. This isn't possible when recovering from a file.
+        if not LINUX and options_list[0] != "":
+            options_list[0] = ""
 
-                #Remove InputFile and switch it with a string that uses /dev/rdisk (raw disk)
-                #instead of /dev/disk.
-                options_list.pop(10)
-                options_list.insert(10, "/dev/r" + SETTINGS["InputFile"].split("/dev/")[1])
+            if SETTINGS["InputFile"][0:5] == "/dev/":
+                options_list[10] = "/dev/r" + SETTINGS["InputFile"].split("/dev/")[1]
 
-            elif option != "":
-                exec_list.append(option)
+        exec_list.extend(option for option in options_list if option != "")
 
         #Start ddrescue.
         logger.debug("MainBackendThread(): Running ddrescue with: '"+' '.join(exec_list)+"'...")
 
         #Ensure the rest of the program knows we are recovering data.
-        SETTINGS["RecoveringData"] = True
+        SETTINGS["RecoveringData"].set()
 
         if not LINUX:
             #Pre-auth with the auth dialog if needed.
             CoreTools.start_process(cmd="echo 'Preauthenticating'", privileged=True)
 
-        cmd = subprocess.Popen(exec_list, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        line = ""
-        char = " " #Set this so the while loop executes at least once.
-
-        #Store reference to Popen object so we can abort on Cygwin. 
-        global DDRESCUE_CMD
-        DDRESCUE_CMD = cmd
-
-        #Give ddrescue plenty of time to start.
-        time.sleep(2)
-
-        #Grab information from ddrescue. (After ddrescue exits, attempt to keep reading chars until
-        #the last attempt gave an empty string)
-        while cmd.poll() is None or char != "":
-            char = cmd.stdout.read(1).decode("utf-8")
-            line += char
-
-            #If this is the end of the line, process it, and send the results to the GUI thread.
-            if char == "\n":
-                tidy_line = line.replace("\n", "").replace("\r", "").replace("\x1b[A", "")
-
-                if tidy_line != "":
-                    try:
-                        self.process_line(tidy_line)
-
-                    except Exception:
-                        #Handle unexpected errors. Can happen once in normal operation on
-                        #ddrescue v1.22+. TODO make smarter, don't fill log with these.
-                        #TODO suppress 1st error if on new versions.
-                        logger.warning("MainBackendThread(): Unexpected error parsing ddrescue's "
-                                       "output! Can happen once on newer versions of ddrescue "
-                                       "(1.22+) in normal operation. Are you running a "
-                                       "newer/older version of ddrescue than we support?")
-
-                #The ¬ is being used to denote where the output box should go up
-                #one line before continuing to write. A bit like a carriage return
-                #but the other way around.
-                wx.CallAfter(self.parent.output_box.update, line.replace("\x1b[A", "¬"))
-
-                #Reset line.
-                line = ""
-
-        #Parse any remaining lines afterwards.
-        if line != "":
-            tidy_line = line.replace("\n", "").replace("\r", "").replace("\x1b[A", "")
-            self.process_line(tidy_line)
+        return_code = asyncio.run(self.run_ddrescue(exec_list))
 
         #Let the GUI know that we are no longer recovering any data.
-        SETTINGS["RecoveringData"] = False
+        SETTINGS["RecoveringData"].clear()
 
         #Check if we got ddrescue's init status, and if ddrescue exited with a status other
         #than 0. Handle errors in case someone is running DDRescue-GUI on an unsupported version
         #of ddrescue.
         #Prepare values.
-        tmp_return_code = int(cmd.returncode)
+        tmp_return_code = int(return_code)
 
         if not self.got_initial_status:
             logger.error("MainBackendThread(): We didn't get the initial status before "
@@ -3832,7 +3808,7 @@ class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attrib
 
         elif tmp_return_code != 0:
             logger.error("MainBackendThread(): ddrescue exited with exit status "
-                         + str(cmd.returncode)+"! Something has gone wrong. Telling "
+                         + str(return_code)+"! Something has gone wrong. Telling "
                          "MainWindow and exiting...")
 
             tmp_result = "BadReturnCode"
@@ -3844,8 +3820,8 @@ class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attrib
             tmp_result = "Success"
 
         try:
-            tmp_disk_capacity = str(self.disk_capacity)+" "+self.disk_capacity_unit
-            tmp_recovered_data = str(int(self.recovered_data))+" "+self.recovered_data_unit
+            tmp_disk_capacity = f"{self.disk_capacity} {self.disk_capacity_unit}"
+            tmp_recovered_data = f"{int(self.recovered_data)} {self.recovered_data_unit}"
 
         except Exception:
             logger.error("MainBackendThread(): Unexpected error while trying to process recovery "
@@ -3859,173 +3835,442 @@ class BackendThread(threading.Thread): #pylint: disable=too-many-instance-attrib
                      recovered_data=tmp_recovered_data, result=tmp_result,
                      return_code=tmp_return_code)
 
-    def process_line(self, line): #pylint: disable=too-many-statements, too-many-branches
+    async def run_ddrescue(self, exec_list):
+        """
+        Start ddrescue, and process its output until it exits.
+
+        Args:
+            exec_list (list).       The command to run ddrescue, as a list.
+
+        Returns:
+            int. ddrescue's exit code.
+        """
+
+        cmd = await asyncio.create_subprocess_exec(*exec_list, stdout=asyncio.subprocess.PIPE,
+                                                   stderr=asyncio.subprocess.STDOUT)
+
+        #Store reference to the process so we can abort on Cygwin.
+        global DDRESCUE_CMD
+        DDRESCUE_CMD = cmd
+
+        try:
+            return await self.process_ddrescue_output(cmd)
+
+        finally:
+            #ddrescue has exited, so there is nothing left to abort.
+            DDRESCUE_CMD = None
+
+    async def process_ddrescue_output(self, cmd):
+        """
+        Process ddrescue's output until it exits.
+
+        Args:
+            cmd (asyncio.subprocess.Process).       The ddrescue process.
+
+        Returns:
+            int. ddrescue's exit code.
+        """
+
+        #Give ddrescue plenty of time to start.
+        await asyncio.sleep(2)
+
+        #Keep the time elapsed up to date, even if ddrescue is paused.
+        time_elapsed_task = asyncio.create_task(self.keep_time_elapsed_updated())
+
+        #Grab information from ddrescue until it closes its end of the pipe. Decode it as
+        #it arrives, rather than a line at a time, and split it into lines ourselves.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        output = ""
+
+        while True:
+            data = await cmd.stdout.read(4096)
+
+            if data == b"":
+                break
+
+            #Process all the complete lines we have, and keep the rest for later.
+            *lines, output = (output+decoder.decode(data)).split("\n")
+
+            for line in lines:
+                self.handle_output_line(line+"\n")
+
+        output += decoder.decode(b"", final=True)
+
+        #Parse any remaining lines afterwards.
+        if output != "":
+            tidy_line = output.translate(LINE_ENDINGS_TABLE).replace("\x1b[A", "")
+            self.process_line(tidy_line)
+            self.post_updates()
+
+        time_elapsed_task.cancel()
+
+        return await cmd.wait()
+
+    async def keep_time_elapsed_updated(self):
+        """
+        Send the time elapsed to the GUI thread every half a second, until cancelled.
+        """
+
+        while True:
+            self.queue_time_elapsed()
+            self.post_updates()
+
+            await asyncio.sleep(0.5)
+
+    def handle_output_line(self, line):
+        """
+        Process a line of ddrescue's output, and send the results to the GUI thread,
+        along with the line itself for the output box.
+
+        Args:
+            line (string).          The line, including the newline character
+                                    at the end.
+        """
+
+        tidy_line = line.translate(LINE_ENDINGS_TABLE).replace("\x1b[A", "")
+
+        if tidy_line != "":
+            try:
+                self.process_line(tidy_line)
+
+            except Exception:
+                #Handle unexpected errors. Can happen once in normal operation on
+                #ddrescue v1.22+. TODO make smarter, don't fill log with these.
+                #TODO suppress 1st error if on new versions.
+                logger.warning("MainBackendThread(): Unexpected error parsing ddrescue's "
+                               "output! Can happen once on newer versions of ddrescue "
+                               "(1.22+) in normal operation. Are you running a "
+                               "newer/older version of ddrescue than we support?")
+
+        #The ¬ is being used to denote where the output box should go up
+        #one line before continuing to write. A bit like a carriage return
+        #but the other way around. ddrescue often outputs the same line many
+        #times, so only do this if the line has changed.
+        if line != self.last_output_line:
+            self.output_box_line = line.replace("\x1b[A", "¬")
+            self.last_output_line = line
+
+        #Always send this, even if it's the same as last time, because the
+        #output box adds it to what's already there.
+        self.pending_updates["output_box"] = self.output_box_line
+
+        #Send everything for this line to the GUI thread in one go.
+        self.post_updates()
+
+    def queue_time_elapsed(self):
+        """
+        Queue an update for the time elapsed, if it has changed since the last one.
+        This is done here rather than in a separate thread, because we don't block
+        while waiting for ddrescue's output. See keep_time_elapsed_updated().
+        """
+
+        if self.start_time is None:
+            return
+
+        runtime_secs = int(time.monotonic() - self.start_time)
+
+        if runtime_secs == self.runtime_secs:
+            return
+
+        self.runtime_secs = runtime_secs
+
+        #Convert between Seconds, Minutes, Hours, and Days to make the value as
+        #understandable as possible.
+        #Only use floating point numbers for hours and days.
+        if runtime_secs <= 60:
+            run_time = runtime_secs
+            unit = " seconds"
+
+        elif runtime_secs <= 3600:
+            run_time = runtime_secs//60
+            unit = " minutes"
+
+        elif runtime_secs <= 86400:
+            run_time = round(runtime_secs/3600, 2)
+            unit = " hours"
+
+        else:
+            run_time = round(runtime_secs/86400, 2)
+            unit = " days"
+
+        self.queue_update("time_elapsed", f"Time Elapsed: {run_time}{unit}")
+
+    def queue_update(self, name, value):
+        """
+        Queue an update for the GUI thread, unless the value is the same as
+        the one we sent last time. Queued updates are sent together by
+        post_updates().
+
+        Args:
+            name (string).          The name of the value to update, eg
+                                    "input_pos". See MainWindow().apply_updates().
+
+            value.                  The new value.
+        """
+
+        if self.last_updates.get(name) != value:
+            self.pending_updates[name] = value
+            self.last_updates[name] = value
+
+    def post_updates(self):
+        """
+        Send all the queued updates to the GUI thread with one call to wx.CallAfter.
+        """
+
+        if self.pending_updates:
+            wx.CallAfter(self.parent.apply_updates, self.pending_updates)
+
+            #The GUI thread now owns that dictionary, so start a new one.
+            self.pending_updates = {}
+
+    def process_line(self, line):
         """
         Process a given line to get ddrescue's current status and recovery information
         and send it to the GUI Thread
         """
 
         split_line = line.split()
+        handler = self.line_handlers.get(split_line[0], self.handle_other_line)
+        handler(split_line, line)
+
+    def handle_initial_status(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle ddrescue's initial status line.
 
-        if split_line[0] == "About":
-            #All versions of ddrescue (1.14 - 1.25).
+        All versions of ddrescue (1.14 - 1.25).
+        """
 
-            #Initial status.
-            logger.info("MainBackendThread().Processline(): Got Initial Status. "
-                        "Setting up the progressbar...")
+        logger.info("MainBackendThread().Processline(): Got Initial Status. "
+                    "Setting up the progressbar...")
 
-            self.got_initial_status = True
+        self.got_initial_status = True
 
-            #pylint: disable=no-member
-            self.disk_capacity, self.disk_capacity_unit = self.get_initial_status(split_line)
+        #pylint: disable=no-member
+        self.disk_capacity, self.disk_capacity_unit = self.get_initial_status(split_line)
 
-            wx.CallAfter(self.parent.set_progress_bar_range, self.disk_capacity)
+        self.queue_update("progress_bar_range", self.disk_capacity)
 
-            #Start time elapsed thread.
-            ElapsedTimeThread(self.parent)
+        #Start keeping track of the time elapsed. ddrescue started a little before
+        #this, so start at 3 seconds.
+        self.start_time = time.monotonic() - 3
 
-        elif split_line[0] == "ipos:" and int(SETTINGS["DDRescueVersion"].split(".")[1]) < 21:
-            #Versions 1.14 - 1.20.
+    def handle_input_pos(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle the input position line.
 
-            #pylint: disable=no-member
-            self.input_pos, self.num_errors, self.average_read_rate, self.average_read_rate_unit \
-            = self.get_inputpos_numerrors_averagereadrate(split_line)
+        Versions 1.14 - 1.20.
+        """
 
-            wx.CallAfter(self.parent.update_input_pos, self.input_pos)
-            wx.CallAfter(self.parent.update_num_errors, self.num_errors)
-            wx.CallAfter(self.parent.update_average_read_rate, str(self.average_read_rate)
-                         + " "+self.average_read_rate_unit)
+        #pylint: disable=no-member
+        self.input_pos, self.num_errors, self.average_read_rate, self.average_read_rate_unit \
+        = self.get_inputpos_numerrors_averagereadrate(split_line)
 
-        elif split_line[0] == "opos:":
-            #Versions 1.14 - 1.20 & 1.21 - 1.25.
+        queue_update = self.queue_update
 
-            if int(SETTINGS["DDRescueVersion"].split(".")[1]) >= 21:
-                #Get average read rate (ddrescue 1.21 - 1.25).
-                (self.output_pos, self.average_read_rate, self.average_read_rate_unit) = \
-                self.get_outputpos_average_read_rate(split_line) #pylint: disable=no-member
+        queue_update("input_pos", self.input_pos)
+        queue_update("num_errors", self.num_errors)
+        queue_update("average_read_rate", f"{self.average_read_rate} {self.average_read_rate_unit}")
 
-                wx.CallAfter(self.parent.update_average_read_rate, str(self.average_read_rate)
-                             + " "+self.average_read_rate_unit)
+    def handle_output_pos_1_14(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle the output position line.
 
-            else:
-                #Output Pos and time since last read (1.14 - 1.20).
-                (self.output_pos, self.time_since_last_read) = \
-                self.get_outputpos_time_since_last_read(split_line) #pylint: disable=no-member
+        Versions 1.14 - 1.19.
+        """
 
-                wx.CallAfter(self.parent.update_time_since_last_read, self.time_since_last_read)
+        #Output Pos and time since last read.
+        (self.output_pos, self.time_since_last_read) = \
+        self.get_outputpos_time_since_last_read(split_line) #pylint: disable=no-member
 
-            #Get remaining time on ddrescue 1.20
-            if int(SETTINGS["DDRescueVersion"].split(".")[1]) == 20:
-                #pylint: disable=no-member
-                self.time_remaining = self.get_time_remaining(split_line)
-                wx.CallAfter(self.parent.update_time_remaining, self.time_remaining)
+        self.queue_update("time_since_last_read", self.time_since_last_read)
+        self.queue_update("output_pos", self.output_pos)
 
-            wx.CallAfter(self.parent.update_output_pos, self.output_pos)
+    def handle_output_pos_1_20(self, split_line, line):
+        """
+        Handle the output position line, which also has the remaining time.
 
-        elif split_line[0] == "non-tried:":
-            #Unreadable data (ddrescue 1.21 - 1.25).
+        Version 1.20.
+        """
 
-            #pylint: disable=no-member
-            self.error_size = self.get_unreadable_data(split_line)
+        self.handle_output_pos_1_14(split_line, line)
 
-            wx.CallAfter(self.parent.update_error_size, self.error_size)
+        #pylint: disable=no-member
+        self.time_remaining = self.get_time_remaining(split_line)
+        self.queue_update("time_remaining", self.time_remaining)
 
-        elif split_line[0] in ("time", "percent"): #Time since last read (ddrescue v1.20 - 1.25).
-            #pylint: disable=no-member
-            self.time_since_last_read = self.get_time_since_last_read(split_line)
+    def handle_output_pos_1_21(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle the output position line, which also has the average read rate.
 
-            wx.CallAfter(self.parent.update_time_since_last_read, self.time_since_last_read)
+        Versions 1.21 - 1.25.
+        """
 
-        elif split_line[0] == "rescued:" and int(SETTINGS["DDRescueVersion"].split(".")[1]) >= 21:
-            #Recovered data and number of errors (ddrescue 1.21 - 1.25).
+        (self.output_pos, self.average_read_rate, self.average_read_rate_unit) = \
+        self.get_outputpos_average_read_rate(split_line) #pylint: disable=no-member
 
-            #Don't crash if we're reading the initial status from the logfile.
-            try:
-                #pylint: disable=no-member
-                (self.recovered_data, self.recovered_data_unit, self.num_errors) = \
-                self.get_recovered_data_num_errors(split_line)
+        self.queue_update("average_read_rate",
+                          f"{self.average_read_rate} {self.average_read_rate_unit}")
 
-                #Change the unit of measurement of the current amount of recovered data if needed.
-                (self.recovered_data, self.recovered_data_unit) = \
-                CoreTools.change_units(float(self.recovered_data), self.recovered_data_unit,
-                                       self.disk_capacity_unit)
+        self.queue_update("output_pos", self.output_pos)
 
-                self.recovered_data = round(self.recovered_data, 3)
+    def handle_unreadable_data(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle the unreadable data line.
 
-                wx.CallAfter(self.parent.update_recovered_data, str(self.recovered_data)
-                             + " "+self.recovered_data_unit)
+        Versions 1.21 - 1.25.
+        """
 
-                wx.CallAfter(self.parent.update_num_errors, self.num_errors)
-                wx.CallAfter(self.parent.update_progress, self.recovered_data, self.disk_capacity)
+        #pylint: disable=no-member
+        self.error_size = self.get_unreadable_data(split_line)
 
-            except AttributeError:
-                pass
+        self.queue_update("error_size", self.error_size)
 
-        elif ("rescued:" in line and split_line[0] not in ("rescued:", "pct")) or "ipos:" in line:
-            #Versions 1.14 - 1.20 & 1.21 - 1.25
+    def handle_time_since_last_read(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle the time since last read line.
 
-            if int(SETTINGS["DDRescueVersion"].split(".")[1]) >= 21:
-                status, info = line.split("ipos:")
+        Versions 1.20 - 1.25.
+        """
 
-            else:
-                status, info = line.split("rescued:")
+        #pylint: disable=no-member
+        self.time_since_last_read = self.get_time_since_last_read(split_line)
+
+        self.queue_update("time_since_last_read", self.time_since_last_read)
+
+    def handle_recovered_data(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle the recovered data and number of errors line.
+
+        Versions 1.21 - 1.25.
+        """
 
-            #Status line.
-            if status != self.old_status:
-                wx.CallAfter(self.parent.update_status_bar, status)
-                self.old_status = status
+        #Don't crash if we're reading the initial status from the logfile.
+        try:
+            #pylint: disable=no-member
+            (self.recovered_data, self.recovered_data_unit, self.num_errors) = \
+            self.get_recovered_data_num_errors(split_line)
 
-            split_line = info.split()
+            #Change the unit of measurement of the current amount of recovered data if needed.
+            (self.recovered_data, self.recovered_data_unit) = \
+            CoreTools.change_units(float(self.recovered_data), self.recovered_data_unit,
+                                   self.disk_capacity_unit)
 
-            if int(SETTINGS["DDRescueVersion"].split(".")[1]) >= 21:
-                #pylint: disable=no-member
-                self.current_read_rate, self.input_pos = self.get_current_rate_inputpos(split_line)
+            recovered_data = round(self.recovered_data, 3)
+            self.recovered_data = recovered_data
 
-                wx.CallAfter(self.parent.update_input_pos, self.input_pos)
+            queue_update = self.queue_update
 
-            else:
-                (self.current_read_rate, self.error_size, self.recovered_data,
-                 self.recovered_data_unit) = \
-                self.get_current_rate_error_size_recovered_data(split_line) #pylint: disable=no-member,line-too-long
+            queue_update("recovered_data", f"{recovered_data} {self.recovered_data_unit}")
+            queue_update("num_errors", self.num_errors)
+            queue_update("progress", (recovered_data, self.disk_capacity))
 
-                #Change the unit of measurement of the current amount of recovered data if needed.
-                (self.recovered_data, self.recovered_data_unit) = \
-                CoreTools.change_units(float(self.recovered_data), self.recovered_data_unit,
-                                       self.disk_capacity_unit)
+        except AttributeError:
+            pass
 
-                self.recovered_data = round(self.recovered_data, 3)
+    def handle_time_remaining(self, split_line, line): #pylint: disable=unused-argument
+        """
+        Handle the time remaining line.
 
-                #Calculate remaining time if not on ddrescue 1.20.
-                if int(SETTINGS["DDRescueVersion"].split(".")[1]) != 20:
-                    #pylint: disable=no-member
-                    self.time_remaining = self.get_time_remaining(self.average_read_rate,
-                                                                  self.average_read_rate_unit,
-                                                                  self.disk_capacity,
-                                                                  self.disk_capacity_unit,
-                                                                  self.recovered_data)
+        Versions 1.21 - 1.25.
+        """
 
-                    wx.CallAfter(self.parent.update_time_remaining, self.time_remaining)
+        #pylint: disable=no-member
+        self.time_remaining = self.get_time_remaining(split_line)
+        self.queue_update("time_remaining", self.time_remaining)
 
-                wx.CallAfter(self.parent.update_error_size, self.error_size)
-                wx.CallAfter(self.parent.update_recovered_data, str(self.recovered_data)
-                             + " "+self.recovered_data_unit)
+    def handle_other_line(self, split_line, line):
+        """
+        Handle lines that can't be identified by their first word. These are
+        either the status line (which may have the current read rate and other
+        information on the end of it), or just status messages.
 
-                wx.CallAfter(self.parent.update_progress, self.recovered_data, self.disk_capacity)
+        Versions 1.14 - 1.20 & 1.21 - 1.25.
+        """
 
-            wx.CallAfter(self.parent.update_current_read_rate, self.current_read_rate)
+        #The status line's marker is often stuck to the end of the status text, so it
+        #isn't always a word on its own. Look for it in the line itself.
+        status, marker, info = line.partition(self.status_line_marker)
 
-        elif split_line[0] == "pct" and int(SETTINGS["DDRescueVersion"].split(".")[1]) >= 21:
-            #pylint: disable=no-member
-            self.time_remaining = self.get_time_remaining(split_line)
-            wx.CallAfter(self.parent.update_time_remaining, self.time_remaining)
+        if marker and split_line[0] not in ("rescued:", "pct"):
+            self.handle_status_line(status, info)
 
         elif "pct" not in line:
             #Probably a status line (maybe the initial one).
-            status = line
+            self.queue_update("status_bar", line)
+
+    def handle_status_line(self, status, info):
+        """
+        Handle the status line, and the information on the end of it.
+
+        Versions 1.14 - 1.20 & 1.21 - 1.25.
+
+        Args:
+            status (string).        The status text before the marker.
+            info (string).          The information after the marker.
+        """
+
+        #Status line.
+        self.queue_update("status_bar", status)
+
+        self.handle_status_info(info.split())
+
+    def handle_status_info_1_14(self, split_line):
+        """
+        Handle the information on the end of the status line, and calculate
+        the remaining time from it.
+
+        Versions 1.14 - 1.19.
+        """
+
+        self.handle_status_info_1_20(split_line)
+
+        #pylint: disable=no-member
+        self.time_remaining = self.get_time_remaining(self.average_read_rate,
+                                                      self.average_read_rate_unit,
+                                                      self.disk_capacity,
+                                                      self.disk_capacity_unit,
+                                                      self.recovered_data)
+
+        self.queue_update("time_remaining", self.time_remaining)
+
+    def handle_status_info_1_20(self, split_line):
+        """
+        Handle the information on the end of the status line.
+
+        Versions 1.14 - 1.20.
+        """
+
+        queue_update = self.queue_update
+
+        (self.current_read_rate, self.error_size, self.recovered_data,
+         self.recovered_data_unit) = \
+        self.get_current_rate_error_size_recovered_data(split_line) #pylint: disable=no-member,line-too-long
+
+        #Change the unit of measurement of the current amount of recovered data if needed.
+        (self.recovered_data, self.recovered_data_unit) = \
+        CoreTools.change_units(float(self.recovered_data), self.recovered_data_unit,
+                               self.disk_capacity_unit)
+
+        recovered_data = round(self.recovered_data, 3)
+        self.recovered_data = recovered_data
+
+        queue_update("error_size", self.error_size)
+        queue_update("recovered_data", f"{recovered_data} {self.recovered_data_unit}")
+        queue_update("progress", (recovered_data, self.disk_capacity))
+        queue_update("current_read_rate", self.current_read_rate)
+
+    def handle_status_info_1_21(self, split_line):
+        """
+        Handle the information on the end of the status line.
+
+        Versions 1.21 - 1.25.
+        """
+
+        #pylint: disable=no-member
+        self.current_read_rate, self.input_pos = self.get_current_rate_inputpos(split_line)
 
-            if status != self.old_status:
-                wx.CallAfter(self.parent.update_status_bar, status)
-                self.old_status = status
+        self.queue_update("input_pos", self.input_pos)
+        self.queue_update("current_read_rate", self.current_read_rate)
 
 #End Backend thread
 if __name__ == "__main__":
@@ -19,37 +19,63 @@
 This module holds the data used for the backend tools tests.
 """
 
+#Test data. This is built once when the module is imported, rather than every time
+#it is requested, because the output of the fast task is quite large.
+#The commands to run.
+ECHO_CMD = """ sh -c "echo 'This is a test of the fire alarm system'" """
+RETURN_2_CMD = """ sh -c "echo 'This returns 2'; exit 2" """
+SLOW_TASK_CMD = """ sh -c "TIMES=1; while [ $TIMES -lt 6 ]; do echo 'Slow task'; sleep 2; TIMES=$(( $TIMES + 1 )); done" """
+FAST_TASK_CMD = """ sh -c "TIMES=1; while [ $TIMES -lt 6000 ]; do echo 'Fast Task'; sleep 0.001; TIMES=$(( $TIMES + 1 )); done" """
+
+FAKE_COMMANDS = {
+    ECHO_CMD: {"Output": "This is a test of the fire alarm system", "Retval": 0},
+    RETURN_2_CMD: {"Output": "This returns 2", "Retval": 2},
+    SLOW_TASK_CMD: {"Output": "\n".join(["Slow task"] * 5), "Retval": 0},
+    FAST_TASK_CMD: {"Output": "\n".join(["Fast Task"] * 5999), "Retval": 0},
+}
+
+FAKE_FILENAMES = {
+    "/dev/ewgrhtjerwhd": {"Result": "...ev/ewgrhtjerwhd"},
+    "/home/hamish/Desktop/img.img": {"Result": ["...Desktop/img.img", "...Desktop/img.i~2"]},
+    "/dev/sda": {"Result": "/dev/sda"},
+    "/home/hamish/Desktop/img2.img": {"Result": ["...Desktop/img.img", "...esktop/img2.img",
+                                                 "...Desktop/img.i~2"]},
+}
+
+#Filenames that clash, in the order they are added, with the key
+#create_unique_key() should give each one when the length is 15.
+COLLIDING_FILENAMES = (
+    #Short keys are checked for clashes too.
+    ("/dev/sda", "/dev/sda"),
+    ("/dev/sda", "/dev/sda~2"),
+
+    #Long paths that share their last 15 characters.
+    ("/home/hamish/Desktop/img.img", "...Desktop/img.img"),
+    ("/home/other/Desktop/img.img", "...Desktop/img.i~2"),
+    ("/media/usb/Desktop/img.img", "...Desktop/img.i~3"),
+
+    #Once the number has 2 digits, the key keeps the same length.
+    ("/mnt/4/Desktop/img.img", "...Desktop/img.i~4"),
+    ("/mnt/5/Desktop/img.img", "...Desktop/img.i~5"),
+    ("/mnt/6/Desktop/img.img", "...Desktop/img.i~6"),
+    ("/mnt/7/Desktop/img.img", "...Desktop/img.i~7"),
+    ("/mnt/8/Desktop/img.img", "...Desktop/img.i~8"),
+    ("/mnt/9/Desktop/img.img", "...Desktop/img.i~9"),
+    ("/mnt/10/Desktop/img.img", "...Desktop/img.~10"),
+)
+
 #Functions to return test data.
 def return_fake_commands():
     """Returns some fake commands to test the start_process function against to make sure it isn't losing output."""
 
-    dictionary = {}
-    dictionary[""" sh -c "echo 'This is a test of the fire alarm system'" """] = {}
-    dictionary[""" sh -c "echo 'This is a test of the fire alarm system'" """]["Output"] = "This is a test of the fire alarm system"
-    dictionary[""" sh -c "echo 'This is a test of the fire alarm system'" """]["Retval"] = 0
-    dictionary[""" sh -c "echo 'This returns 2'; exit 2" """] = {}
-    dictionary[""" sh -c "echo 'This returns 2'; exit 2" """]["Output"] = "This returns 2"
-    dictionary[""" sh -c "echo 'This returns 2'; exit 2" """]["Retval"] = 2
-    dictionary[""" sh -c "TIMES=1; while [ $TIMES -lt 6 ]; do echo 'Slow task'; sleep 2; TIMES=$(( $TIMES + 1 )); done" """] = {}
-    dictionary[""" sh -c "TIMES=1; while [ $TIMES -lt 6 ]; do echo 'Slow task'; sleep 2; TIMES=$(( $TIMES + 1 )); done" """]["Output"] = "Slow task\n"*4 + "Slow task"
-    dictionary[""" sh -c "TIMES=1; while [ $TIMES -lt 6 ]; do echo 'Slow task'; sleep 2; TIMES=$(( $TIMES + 1 )); done" """]["Retval"] = 0
-    dictionary[""" sh -c "TIMES=1; while [ $TIMES -lt 6000 ]; do echo 'Fast Task'; sleep 0.001; TIMES=$(( $TIMES + 1 )); done" """] = {}
-    dictionary[""" sh -c "TIMES=1; while [ $TIMES -lt 6000 ]; do echo 'Fast Task'; sleep 0.001; TIMES=$(( $TIMES + 1 )); done" """]["Output"] = "Fast Task\n"*5998 + "Fast Task"
-    dictionary[""" sh -c "TIMES=1; while [ $TIMES -lt 6000 ]; do echo 'Fast Task'; sleep 0.001; TIMES=$(( $TIMES + 1 )); done" """]["Retval"] = 0
-
-    return dictionary
+    return FAKE_COMMANDS
 
 def return_fake_filenames():
     """Returns some fake filenames to test the create_unique_key function against."""
 
-    dictionary = {}
-    dictionary["/dev/ewgrhtjerwhd"] = {}
-    dictionary["/dev/ewgrhtjerwhd"]["Result"] = "...ev/ewgrhtjerwhd"
-    dictionary["/home/hamish/Desktop/img.img"] = {}
-    dictionary["/home/hamish/Desktop/img.img"]["Result"] = ["...Desktop/img.img", "...Desktop/img.i~2"]
-    dictionary["/dev/sda"] = {}
-    dictionary["/dev/sda"]["Result"] = "/dev/sda"
-    dictionary["/home/hamish/Desktop/img2.img"] = {}
-    dictionary["/home/hamish/Desktop/img2.img"]["Result"] = ["...Desktop/img.img", "...esktop/img2.img", "...Desktop/img.i~2"]
-
-    return dictionary
+    return FAKE_FILENAMES
+
+def return_colliding_filenames():
+    """Returns some clashing filenames, and the keys create_unique_key should give them."""
+
+    return COLLIDING_FILENAMES
@@ -23,9 +23,10 @@ functions to aid testing the ones in BackendTools.
 #Do other imports.
 import subprocess
 import threading
-import time
 import os
 import shlex
+import re
+import functools
 import sys
 import wx
 
@@ -51,9 +52,58 @@ elif "wxMac" in wx.PlatformInfo:
     LINUX = False
     PARTED_MAGIC = False
 
-AUTH_DIALOG_OPEN = False
+#Set whenever the authentication dialog isn't open.
+AUTH_DIALOG_CLOSED = threading.Event()
+AUTH_DIALOG_CLOSED.set()
+
 APPICON = None
 
+#Images used by AuthWindow. See get_image().
+IMAGES = {}
+
+#The environment used to run getdevinfo with sudo on macOS. This fixes the import
+#paths, which is necessary because the support for running extra python processes
+#in py2app is poor.
+PYTHON_LIB_PATH = RESOURCEPATH+"/lib/python"+str(sys.version_info[0])+str(sys.version_info[1])
+
+GETDEVINFO_ENVIRON = ["LC_ALL=C", "PYTHONHOME="+RESOURCEPATH,
+                      "PYTHONPATH="+PYTHON_LIB_PATH+".zip:"+PYTHON_LIB_PATH+":"
+                      + PYTHON_LIB_PATH+"/lib-dynload:"+PYTHON_LIB_PATH+"/site-packages.zip:"
+                      + PYTHON_LIB_PATH+"/site-packages"]
+
+#The helper scripts used to run privileged commands on Linux, and patterns that
+#match the commands that need them, in the order they are checked.
+HELPER_PATTERNS = (
+    (re.compile(r"run_getdevinfo\.py"), "runasroot_linux_getdevinfo.sh"),
+    (re.compile(r"umount|kpartx -d"), "runasroot_linux_umount.sh"),
+
+    #Note: These are only used in the process of mounting files.
+    (re.compile(r"mount|kpartx -l|kpartx -a|lsblk|partprobe"), "runasroot_linux_mount.sh"),
+
+    (re.compile(r"^(?!.*killall).* ddrescue ", re.DOTALL), "runasroot_linux_ddrescue.sh"),
+)
+
+#Matches the octal escapes used in /proc/self/mountinfo.
+MOUNT_PATH_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+def get_image(name, loader):
+    """
+    Get one of the images used by AuthWindow. They are loaded the first time
+    they are needed, and then reused every time the window is opened.
+
+    Args:
+        name (string).          The name of the image.
+        loader (function).      Loads the image. Only called the first time.
+
+    Returns:
+        The image.
+    """
+
+    if name not in IMAGES:
+        IMAGES[name] = loader()
+
+    return IMAGES[name]
+
 #Begin Mac Authentication Window.
 class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instance-attributes
     """
@@ -75,7 +125,8 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
 
         #Set the frame's icon.
         global APPICON
-        APPICON = wx.Icon(RESOURCEPATH+"/images/Logo.png", wx.BITMAP_TYPE_PNG)
+        APPICON = get_image("Icon", lambda: wx.Icon(RESOURCEPATH+"/images/Logo.png",
+                                                    wx.BITMAP_TYPE_PNG))
         wx.Frame.SetIcon(self, APPICON)
 
         self.create_text()
@@ -117,8 +168,10 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         Create all other widgets for AuthenticationWindow
         """
         #Create the image.
-        img = wx.Image(RESOURCEPATH+"/images/Logo.png", wx.BITMAP_TYPE_PNG)
-        self.program_logo = wx.StaticBitmap(self.panel, -1, wx.Bitmap(img))
+        logo = get_image("Logo", lambda: wx.Bitmap(wx.Image(RESOURCEPATH+"/images/Logo.png",
+                                                            wx.BITMAP_TYPE_PNG)))
+
+        self.program_logo = wx.StaticBitmap(self.panel, -1, logo)
 
         #Create the password field.
         self.password_field = wx.TextCtrl(self.panel, -1, "",
@@ -127,13 +180,21 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         self.password_field.SetBackgroundColour((255, 255, 255))
 
         #Create the throbber.
-        self.busy = wx.adv.Animation(RESOURCEPATH+"/images/Throbber.gif")
-        self.green_pulse = wx.adv.Animation(RESOURCEPATH+"/images/GreenPulse.gif")
-        self.red_pulse = wx.adv.Animation(RESOURCEPATH+"/images/RedPulse.gif")
+        self.busy = get_image("Throbber",
+                              lambda: wx.adv.Animation(RESOURCEPATH+"/images/Throbber.gif"))
+
+        self.green_pulse = get_image("GreenPulse",
+                                     lambda: wx.adv.Animation(RESOURCEPATH
+                                                              + "/images/GreenPulse.gif"))
+
+        self.red_pulse = get_image("RedPulse",
+                                   lambda: wx.adv.Animation(RESOURCEPATH+"/images/RedPulse.gif"))
 
         self.throbber = wx.adv.AnimationCtrl(self.panel, -1, self.green_pulse)
-        self.throbber.SetInactiveBitmap(wx.Bitmap(RESOURCEPATH+"/images/ThrobberRest.png",
-                                                  wx.BITMAP_TYPE_PNG))
+        self.throbber.SetInactiveBitmap(get_image("ThrobberRest",
+                                                  lambda: wx.Bitmap(RESOURCEPATH
+                                                                    + "/images/ThrobberRest.png",
+                                                                    wx.BITMAP_TYPE_PNG)))
 
         self.throbber.SetClientSize(wx.Size(30, 30))
 
@@ -205,27 +266,43 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         #Disable the auth button (stops you from trying twice in quick succession).
         self.auth_button.Disable()
 
-        #Check the password is right.
         password = self.password_field.GetLineText(0)
-        cmd = subprocess.Popen("LC_ALL=C sudo -S echo 'Authentication Succeeded'",
+
+        self.throbber.SetAnimation(self.busy)
+        self.throbber.Play()
+
+        #Check the password in another thread, so the throbber keeps playing.
+        threading.Thread(target=self.check_password, args=(password,)).start()
+
+    def check_password(self, password):
+        """
+        Check the password is correct, and tell the GUI thread the result.
+        Called in a separate thread by on_auth_attempt().
+
+        Args:
+            password (string).      The password the user entered.
+        """
+
+        cmd = subprocess.Popen(["sudo", "-S", "echo", "Authentication Succeeded"],
                                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE, shell=True)
+                               stderr=subprocess.PIPE, env=dict(os.environ, LC_ALL="C"))
 
         #Send the password to sudo through stdin,
         #to avoid showing the user's password in the system/activity monitor.
-        cmd.stdin.write(password.encode()+b"\n")
-        cmd.stdin.close()
+        output = cmd.communicate(input=(password+"\n").encode())[0].decode("utf-8")
 
-        self.throbber.SetAnimation(self.busy)
-        self.throbber.Play()
+        wx.CallAfter(self.on_auth_result, "Authentication Succeeded" in output)
 
-        while cmd.poll() is None:
-            #wx.GetApp().Yield()
-            time.sleep(0.04)
+    def on_auth_result(self, succeeded):
+        """
+        Show the user whether authentication succeeded. If so, exit. If not,
+        let the user try again.
 
-        output = cmd.stdout.read().decode("utf-8")
+        Args:
+            succeeded (bool).       Whether the password was correct.
+        """
 
-        if "Authentication Succeeded" in output:
+        if succeeded:
             #Set the password field colour to green and disable the cancel button.
             self.password_field.SetBackgroundColour((192, 255, 192))
             self.password_field.SetValue("ABCDEFGHIJKLMNOPQRSTUVWXYZ123456789!£$%^&*()_+")
@@ -242,19 +319,7 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
 
             #Shake the window
             x_pos, y_pos = self.GetPosition()
-            count = 0
-
-            while count <= 6:
-                if count % 2 == 0:
-                    x_pos -= 10
-
-                else:
-                    x_pos += 10
-
-                time.sleep(0.02)
-                self.SetPosition((x_pos, y_pos))
-                #wx.GetApp().Yield()
-                count += 1
+            wx.CallLater(20, self.shake_window, 0, x_pos, y_pos)
 
             #Set the password field colour to pink, and select its text.
             self.password_field.SetBackgroundColour((255, 192, 192))
@@ -266,6 +331,29 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
             self.throbber.Play()
             wx.CallLater(1000, self.throbber.Stop)
 
+    def shake_window(self, count, x_pos, y_pos):
+        """
+        Move the window one step while shaking it, and schedule the next step,
+        so the window is redrawn in between.
+
+        Args:
+            count (int).            The number of steps done so far.
+            x_pos (int).            The window's current x position.
+            y_pos (int).            The window's current y position.
+        """
+
+        if count > 6:
+            return
+
+        if count % 2 == 0:
+            x_pos -= 10
+
+        else:
+            x_pos += 10
+
+        self.SetPosition((x_pos, y_pos))
+        wx.CallLater(20, self.shake_window, count+1, x_pos, y_pos)
+
     def test_auth(): #pylint: disable=no-method-argument
         """
         Check if we have cached authentication.
@@ -275,21 +363,14 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
                             False = We don't.
         """
 
-        #Check the password is right.
-        cmd = subprocess.Popen("LC_ALL=C sudo -S echo 'Authentication Succeeded'",
-                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE, shell=True)
-
-        #Send the password to sudo through stdin,
-        #to avoid showing the user's password in the system/activity monitor.
-        cmd.stdin.close()
-
-        while cmd.poll() is None:
-            time.sleep(0.04)
-
-        output = cmd.stdout.read().decode("utf-8")
+        #Check the password is right. Don't send a password, so this fails
+        #straight away if there are no cached credentials.
+        cmd = subprocess.run(["sudo", "-S", "echo", "Authentication Succeeded"],
+                             stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, env=dict(os.environ, LC_ALL="C"),
+                             check=False)
 
-        return "Authentication Succeeded" in output
+        return "Authentication Succeeded" in cmd.stdout.decode("utf-8")
 
     def run(): #pylint: disable=no-method-argument
         """
@@ -297,14 +378,12 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         pre-authenticated, just return immediately.
         """
 
-        global AUTH_DIALOG_OPEN
-
         #Use cached credentials rather than open the auth window if possible.
         if AuthWindow.test_auth():
-            AUTH_DIALOG_OPEN = False
+            AUTH_DIALOG_CLOSED.set()
             return
 
-        AUTH_DIALOG_OPEN = True
+        AUTH_DIALOG_CLOSED.clear()
 
         AuthWindow().Show()
 
@@ -312,13 +391,13 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         """
         Close AuthWindow() and exit
         """
-        global AUTH_DIALOG_OPEN
-        AUTH_DIALOG_OPEN = False
-
         self.Destroy()
 
+        AUTH_DIALOG_CLOSED.set()
+
 #End Mac Authentication Window.
 
+@functools.lru_cache(maxsize=256)
 def get_helper(cmd):
     """
     Figure out which helper script to use for this command.
@@ -327,29 +406,19 @@ def get_helper(cmd):
         cmd (string).           The command(s) about to be run.
 
     Returns:
-        string.                 "pkexec" + <the helper script needed>
-                                + the command(s) to run.
+        tuple.                  "pkexec" and the path to the helper script
+                                needed, to go in front of the command's
+                                arguments.
     """
-    helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux.sh"
-
-    if "run_getdevinfo.py" in cmd:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_getdevinfo.sh"
-
-    elif "umount" in cmd or "kpartx -d" in cmd:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_umount.sh"
-
-    elif ("mount" in cmd or "kpartx -l" in cmd or "kpartx -a" in cmd or "lsblk" in cmd
-          or "partprobe" in cmd):
-        #Note: These are only used in the process of mounting files.
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_mount.sh"
-
-    elif " ddrescue " in cmd and "killall" not in cmd:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_ddrescue.sh"
+    helper = "runasroot_linux.sh"
 
-    else:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux.sh"
+    #Use the first helper script that matches.
+    for pattern, helper_script in HELPER_PATTERNS:
+        if pattern.search(cmd):
+            helper = helper_script
+            break
 
-    return "pkexec "+helper
+    return ("pkexec", "/usr/share/ddrescue-gui/Tools/helpers/"+helper)
 
 def start_process(cmd, return_output=False, privileged=False):
     """
@@ -377,74 +446,64 @@ def start_process(cmd, return_output=False, privileged=False):
                                 newline characters.
 
     """
-    #Save the command as it was passed, in case we need
-    #to call recursively (pkexec auth failure/dismissal).
-    origcmd = cmd
+    #Split the command once. Anything else we need to run it is added to the front
+    #of the list.
+    argv = shlex.split(cmd)
 
     #If this is to be a privileged process, add the helper script to the cmdline.
     if privileged:
         if LINUX:
-            helper = get_helper(cmd)
-
-            cmd = helper+" "+cmd
+            argv = [*get_helper(cmd), *argv]
 
         else:
-            #Pre-authenticate with the auth dialog. Not py2 compatible, but only used
-            #on OS X builds, which are py3-only anyway.
-            if threading.current_thread() == threading.main_thread():
-                AuthWindow.run()
-
-            else:
-                wx.CallAfter(AuthWindow.run)
-
-                #Prevent a race condition.
-                global AUTH_DIALOG_OPEN
-                AUTH_DIALOG_OPEN = True
-
-            #Make sure the throbber plays properly and the window is responsive.
-            while AUTH_DIALOG_OPEN:
-                wx.GetApp().Yield()
-                time.sleep(0.04)
-
             #Set up the environemt here - sudo will clear it if we do it the
             #wrong way.
             if "/Tools/run_getdevinfo.py" in cmd:
                 #Fix import paths on macOS.
-                #This is necessary because the support for running extra python processes
-                #in py2app is poor.
-                major = sys.version_info[0]
-                minor = sys.version_info[1]
-
-                environ = 'LC_ALL="C" PYTHONHOME="'+RESOURCEPATH+'" PYTHONPATH="' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'.zip:' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+':' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'/lib-dynload:' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'/site-packages.zip:' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'/site-packages" '
+                environ = GETDEVINFO_ENVIRON
 
             else:
-                environ = 'LC_ALL="C" '
+                environ = ["LC_ALL=C"]
 
-            cmd = "sudo -SH "+environ+cmd
+            argv = ["sudo", "-SH"]+environ+argv
 
     environ = dict(os.environ, LC_ALL="C")
 
-    cmd = shlex.split(cmd)
+    #Keep trying if authentication is dismissed, or the wrong password is entered 3 times.
+    while True:
+        if privileged and not LINUX:
+            #Pre-authenticate with the auth dialog. Not py2 compatible, but only used
+            #on OS X builds, which are py3-only anyway.
+            if threading.current_thread() == threading.main_thread():
+                AuthWindow.run()
+
+                #Make sure the throbber plays properly and the window is responsive.
+                while not AUTH_DIALOG_CLOSED.is_set():
+                    wx.GetApp().Yield()
+                    AUTH_DIALOG_CLOSED.wait(0.04)
+
+            else:
+                #Prevent a race condition.
+                AUTH_DIALOG_CLOSED.clear()
+
+                wx.CallAfter(AuthWindow.run)
 
-    runcmd = subprocess.Popen(cmd, stdout=subprocess.PIPE,
-                              stderr=subprocess.STDOUT, env=environ,
-                              shell=False)
+                #Wait until the dialog has been closed.
+                AUTH_DIALOG_CLOSED.wait()
 
-    #Save the output, and runcmd.returncode,
-    #as they tend to reset fairly quickly. Handle unicode properly.
-    output = read(runcmd)
+        #Nothing is sent to the command, so don't let it read from our stdin.
+        runcmd = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, env=environ,
+                                  shell=False)
 
-    retval = int(runcmd.returncode)
+        #Save the output, and runcmd.returncode. read() waits for the command
+        #to exit, so the return code is always set. Handle unicode properly.
+        output = read(runcmd)
 
-    if privileged and (retval == 126 or retval == 127):
-        #Try again, auth dismissed / bad password 3 times.
-        #A lot of recursion is allowed (~1000 times), so this shouldn't be a problem.
-        return start_process(cmd=origcmd, return_output=return_output, privileged=privileged)
+        retval = runcmd.returncode
+
+        if not (privileged and retval in (126, 127)):
+            break
 
     if not return_output:
         #Return the return code back to whichever function ran this process, so it handles errors.
@@ -456,8 +515,8 @@ def start_process(cmd, return_output=False, privileged=False):
 
 def read(cmd, testing=False):
     """
-    Read the cmd's output character by character. Also make sure everything is
-    converted to unicode. Break lines by the newline and
+    Read all of the cmd's output, and wait for it to exit. Also make sure
+    everything is converted to unicode. Break lines by the newline and
     (carriage return) characters. Also handle null characters by
     removing them from the output.
 
@@ -475,104 +534,119 @@ def read(cmd, testing=False):
 
     """
 
-    #Get ready to run the command(s).
-    #Read up to 100 empty "" characters after the process finishes to
-    #make sure we get all the output.
-    counter = 0
-    line = bytes(b"")
-    line_list = []
+    #Read everything in one go, rather than a character at a time. This returns
+    #when the command closes its output, and then we wait for it to exit so its
+    #return code is set.
+    output = cmd.stdout.read()
+    cmd.wait()
 
-    while cmd.poll() is None or counter < 100:
-        char = cmd.stdout.read(1)
+    #Remove "NULL" characters and interpret as Unicode.
+    output = output.translate(None, b"\x00").decode("UTF-8", errors="ignore")
 
-        if char == b"":
-            counter += 1
-            continue
+    #Break lines at every newline and carriage return character. Keep them
+    #at the end of each line if we're testing.
+    if testing:
+        line_list = re.split("(?<=[\n\r])", output)
 
-        line += char
+    else:
+        line_list = re.split("[\n\r]", output)
 
-        if char in (b"\n", b"\r"):
-            #Interpret as Unicode and remove "NULL" characters.
-            line = line.decode("UTF-8", errors="ignore").replace("\x00", "")
+    #Catch it if there's a newline at the end.
+    if line_list[-1] == "":
+        line_list.pop()
 
-            if testing:
-                line_list.append(line)
+    return line_list
 
-            else:
-                line_list.append(line.replace("\n", "").replace("\r", ""))
+def unescape_mount_path(path):
+    """
+    Replace the octal escapes the kernel uses for spaces, tabs, newlines, and
+    backslashes in /proc/self/mountinfo with the characters themselves.
 
-            #Reset line.
-            line = bytes(b"")
+    Args:
+        path (string).          The path from /proc/self/mountinfo.
 
-    #Catch it if there's not a newline at the end.
-    if line != b"":
-        #Interpret as Unicode and remove "NULL" characters.
-        line = line.decode("UTF-8", errors="ignore").replace("\x00", "")
+    Returns:
+        string.                 The path without escapes.
+    """
 
-        if testing:
-            line_list.append(line)
+    return MOUNT_PATH_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), path)
 
-        else:
-            line_list.append(line.replace("\n", "").replace("\r", ""))
+def get_mounts():
+    """
+    Get the devices that are mounted, and where they are mounted.
 
-    return line_list
+    Returns:
+        list.                   A list of (device, mount point) tuples.
+    """
 
-def is_mounted(partition, mount_point=None):
+    mounts = []
+
+    if LINUX:
+        #Read the kernel's mount table, rather than running mount. The mount
+        #point is the 5th field, and the device is the 2nd field after the "-".
+        with open("/proc/self/mountinfo") as mount_table:
+            for line in mount_table:
+                fields, rest = line.split(" - ")
+                mount_point = fields.split(None, 5)[4]
+                device = rest.split(None, 2)[1]
+
+                mounts.append((unescape_mount_path(device), unescape_mount_path(mount_point)))
+
+        return mounts
+
+    mount_info = start_process("mount", return_output=True)[1]
+
+    #Lines look like "<device> on <mount point> (<options>)". We only need the
+    #first 3 words.
+    for line in mount_info.splitlines():
+        split_line = line.split(None, 3)
+
+        if len(split_line) != 0:
+            mounts.append((split_line[0], split_line[2]))
+
+    return mounts
+
+def is_mounted(partition, mount_point=None, mounts=None):
     """Checks if the given partition is mounted.
     partition is the given partition to check.
     If mount_point is specified, check if the partition is mounted there,
     rather than just if it's mounted.
+    mounts is optional, and can be the output of get_mounts(), to save running
+    mount again.
 
     Return boolean True/False.
     """
 
-    if mount_point is None:
-        mount_info = start_process("mount", return_output=True)[1]
-
-        mounted = False
+    if mounts is None:
+        mounts = get_mounts()
 
+    if mount_point is None:
         #OS X fix: Handle paths with /tmp in them, as paths with /private/tmp.
         if not LINUX and "/tmp" in partition:
             partition = partition.replace("/tmp", "/private/tmp")
 
         #LINUX fix: Accept any mount_point when called with just one argument.
-        for line in mount_info.split("\n"):
-            if len(line) != 0:
-                if line.split()[0] == partition or line.split()[2] == partition:
-                    mounted = True
-                    break
-
-    else:
-        #Check where it's mounted to.
-        mounted = False
+        return any(partition in mount for mount in mounts)
 
-        #OS X fix: Handle paths with /tmp in them, as paths with /private/tmp.
-        if not LINUX and "/tmp" in mount_point:
-            mount_point = mount_point.replace("/tmp", "/private/tmp")
-
-        if get_mount_point(partition) == mount_point:
-            mounted = True
+    #Check where it's mounted to.
+    #OS X fix: Handle paths with /tmp in them, as paths with /private/tmp.
+    if not LINUX and "/tmp" in mount_point:
+        mount_point = mount_point.replace("/tmp", "/private/tmp")
 
-    return mounted
+    return get_mount_point(partition, mounts) == mount_point
 
-def get_mount_point(partition):
+def get_mount_point(partition, mounts=None):
     """
     Returns the mount_point of the given partition, if any.
     Otherwise, return None
+    mounts is optional, and can be the output of get_mounts(), to save running
+    mount again.
     """
 
-    mount_info = start_process("mount", return_output=True)[1]
-    mount_point = None
+    if mounts is None:
+        mounts = get_mounts()
 
-    for line in mount_info.split("\n"):
-        split_line = line.split()
-
-        if len(split_line) != 0:
-            if partition == split_line[0]:
-                mount_point = split_line[2]
-                break
-
-    return mount_point
+    return next((point for device, point in mounts if device == partition), None)
 
 def mount_disk(partition, mount_point, options=""):
     """
@@ -583,21 +657,21 @@ def mount_disk(partition, mount_point, options=""):
     The default value for options is an empty string.
     """
 
-    mount_info = start_process("mount", return_output=True)[1]
+    #Only run mount once to check everything.
+    mounts = get_mounts()
 
     #There is a partition mounted here. Check if it's ours.
-    if mount_point == get_mount_point(partition):
+    if mount_point == get_mount_point(partition, mounts):
         #The correct partition is already mounted here.
         return 0
 
-    elif mount_point in mount_info:
+    elif mount_point in (point for device, point in mounts):
         #Something else is in the way. Unmount that partition, and continue.
         if unmount_disk(mount_point) != 0:
             return False
 
     #Create the dir if needed.
-    if os.path.isdir(mount_point) is False:
-        os.makedirs(mount_point)
+    os.makedirs(mount_point, exist_ok=True)
 
     #Mount the device to the mount point.
     #Use diskutil on OS X.
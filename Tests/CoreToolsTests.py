@@ -21,14 +21,14 @@ These are the backend tools tests.
 
 #Import modules
 import unittest
+from unittest import mock
+import io
 import os
-import sys
+import shlex
+import types
 import wx
 import wx.adv
 
-#Allow imports of modules & packages 1 level up.
-sys.path.insert(0, os.path.abspath('..'))
-
 #Import tools.
 from Tools import core as CoreTools #pylint: disable=import-error
 
@@ -50,18 +50,100 @@ elif "wxMac" in wx.PlatformInfo:
     LINUX = False
     PARTED_MAGIC = False
 
-#Set up autocomplete vars.
+#Set up autocomplete vars. Set DDRESCUEGUI_TESTS_PARTITION to skip being asked
+#for a partition to test against.
 POTENTIAL_DEVICE_PATH = ""
-POTENTIAL_PARTITION_PATH = ""
+POTENTIAL_PARTITION_PATH = os.environ.get("DDRESCUEGUI_TESTS_PARTITION", "")
+
+#Temporary mount point for the mounting tests.
+MOUNT_POINT = "/tmp/ddrescueguimtpt"
+
+#Set this environment variable to run the real commands in TestStartProcess,
+#and send a real notification in TestSendNotification, rather than faking
+#them. This is much slower, and needs someone to answer the dialogs.
+REAL_PROCESSES = "DDRESCUEGUI_TESTS_REAL_PROCESSES" in os.environ
+
+def get_partition_path():
+    """
+    Get a partition path to test against. The user is only asked the first
+    time, and the path is reused by all of the tests after that.
+
+    Returns:
+        string.         The partition path.
+    """
+
+    global POTENTIAL_PARTITION_PATH
+
+    if POTENTIAL_PARTITION_PATH == "":
+        dlg = wx.TextEntryDialog(None, "DDRescue-GUI needs a partition name to test against.\n"
+                                 +"No data on your device will be modified. Suggested: "
+                                 +"insert a USB disk and leave it mounted.\nNote: Do not use "
+                                 +"your device while these tests are running, or it may "
+                                 +"interfere with the tests.", "DDRescue-GUI Tests",
+                                 POTENTIAL_PARTITION_PATH, style=wx.OK)
+
+        dlg.ShowModal()
+        POTENTIAL_PARTITION_PATH = dlg.GetValue()
+        dlg.Destroy()
+
+    return POTENTIAL_PARTITION_PATH
+
+class FakeProcess():
+    """
+    Stands in for a subprocess.Popen object that has already finished, so
+    start_process() can be tested without starting any processes.
+    """
+
+    def __init__(self, output, retval):
+        """
+        Args:
+            output (bytes).         What the command writes to stdout.
+            retval (int).           The command's return value.
+        """
+
+        self.stdout = io.BytesIO(output)
+        self.returncode = retval
+
+    def poll(self):
+        """Return the return value, as the command has finished."""
+        return self.returncode
+
+    def wait(self):
+        """Return the return value, as the command has finished."""
+        return self.returncode
+
+    def communicate(self, input=None): #pylint: disable=redefined-builtin,unused-argument
+        """Return the command's output."""
+        return (self.stdout.read(), None)
 
 class TestStartProcess(unittest.TestCase):
     """Tests for start_process()"""
 
+    @classmethod
+    def setUpClass(cls):
+        #The test data is shared by every test, so make sure none of them change it.
+        cls.commands = types.MappingProxyType(Data.return_fake_commands())
+
+        #Start the fake commands instead, by the arguments start_process() passes.
+        #Their output is encoded up front, as it would come from a real pipe.
+        cls.fake_commands = {tuple(shlex.split(command)):
+                             ((info["Output"]+"\n").encode("utf-8"), info["Retval"])
+                             for command, info in cls.commands.items()}
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.commands
+        del cls.fake_commands
+
     def setUp(self):
-        self.commands = Data.return_fake_commands()
+        if not REAL_PROCESSES:
+            patcher = mock.patch("Tools.core.subprocess.Popen", side_effect=self.start_fake_process)
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
-    def tearDown(self):
-        del self.commands
+    def start_fake_process(self, cmd, **kwargs): #pylint: disable=unused-argument
+        """Return a FakeProcess for the given command, with its expected output."""
+        return FakeProcess(*self.fake_commands[tuple(cmd)])
 
     def test_start_process(self):
         """Simple test for start_process()"""
@@ -73,13 +155,19 @@ class TestStartProcess(unittest.TestCase):
 class TestCreateUniqueKey(unittest.TestCase):
     """Tests for create_unique_key()"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.filenames = types.MappingProxyType(Data.return_fake_filenames())
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.filenames
+
     def setUp(self):
         self.keys_dictionary = {}
-        self.filenames = Data.return_fake_filenames()
 
     def tearDown(self):
         del self.keys_dictionary
-        del self.filenames
 
     def test_create_unique_key(self):
         """Simple test for create_unique_key()"""
@@ -88,16 +176,36 @@ class TestCreateUniqueKey(unittest.TestCase):
             self.assertTrue(key in self.filenames[_file]["Result"])
             self.keys_dictionary[key] = ""
 
+    def test_create_unique_key_collisions(self):
+        """Test create_unique_key() with filenames whose keys clash"""
+        for _file, expected_key in Data.return_colliding_filenames():
+            key = CoreTools.create_unique_key(self.keys_dictionary, _file, 15)
+            self.assertEqual(key, expected_key)
+            self.keys_dictionary[key] = _file
+
 class TestSendNotification(unittest.TestCase):
     """Tests for send_notification()"""
 
     def setUp(self):
-        self.app = wx.App()
+        if REAL_PROCESSES:
+            self.app = wx.App()
 
     def tearDown(self):
-        self.app.Destroy()
-        del self.app
+        if REAL_PROCESSES:
+            self.app.Destroy()
+            del self.app
+
+    @unittest.skipIf(REAL_PROCESSES, "Sending a real notification instead")
+    def test_send_notification_fake(self):
+        """Check send_notification() runs the notifier with the message"""
+        with mock.patch("Tools.core.start_process") as start_process:
+            CoreTools.send_notification("Test Message from unit tests.")
 
+        start_process.assert_called_once()
+        self.assertIn("Test Message from unit tests.", start_process.call_args[1]["cmd"])
+        self.assertFalse(start_process.call_args[1]["return_output"])
+
+    @unittest.skipUnless(REAL_PROCESSES, "Needs someone to check the notification arrives")
     def test_send_notification(self):
         """Simple test for send_notification()"""
         #Tell the user we are about to send a notification.
@@ -125,55 +233,55 @@ class TestSendNotification(unittest.TestCase):
 
         self.assertEqual(result, wx.ID_YES)
 
-class TestIsMounted(unittest.TestCase):
-    """Tests for is_mounted()"""
+class MountTestCase(unittest.TestCase):
+    """
+    Base class for the tests that mount partitions. Creates one wx.App per
+    class, and gets the partition to test against.
+    """
 
-    def setUp(self):
-        self.app = wx.App()
+    @classmethod
+    def setUpClass(cls):
+        cls.app = wx.App()
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.Destroy()
+        del cls.app
+
+    def setUp(self):
         #Get a device path from the user to test against.
-        global POTENTIAL_PARTITION_PATH
+        self.path = get_partition_path()
 
-        self.path = POTENTIAL_PARTITION_PATH
+    def tearDown(self):
+        del self.path
 
-        if POTENTIAL_PARTITION_PATH == "":
-            dlg = wx.TextEntryDialog(None, "DDRescue-GUI needs a partition name to test against.\n"
-                                     +"No data on your device will be modified. Suggested: "
-                                     +"insert a USB disk and leave it mounted.\nNote: Do not use "
-                                     +"your device while these tests are running, or it may "
-                                     +"interfere with the tests.", "DDRescue-GUI Tests",
-                                     POTENTIAL_PARTITION_PATH, style=wx.OK)
+    @staticmethod
+    def remove_mount_point():
+        """Remove our temporary mount point and its subdirectory, if they exist."""
+        for directory in (MOUNT_POINT+"/subdir", MOUNT_POINT):
+            try:
+                os.rmdir(directory)
 
-            dlg.ShowModal()
-            self.path = dlg.GetValue()
-            dlg.Destroy()
-            POTENTIAL_PARTITION_PATH = self.path
+            except FileNotFoundError:
+                pass
 
-        #Save it for autocomplete with other dialogs.
-        POTENTIAL_PARTITION_PATH = self.path
+class TestIsMounted(MountTestCase):
+    """Tests for is_mounted()"""
 
     def tearDown(self):
         #Check if anything is mounted at our temporary mount point.
         if Functions.is_mounted(self.path):
             Functions.unmount_disk(self.path)
 
-        #Remove the mount point.
-        if os.path.isdir("/tmp/ddrescueguimtpt"):
-            if os.path.isdir("/tmp/ddrescueguimtpt/subdir"):
-                os.rmdir("/tmp/ddrescueguimtpt/subdir")
-
-            os.rmdir("/tmp/ddrescueguimtpt")
-
-        self.app.Destroy()
-        del self.app
-        del self.path
+        self.remove_mount_point()
+        super().tearDown()
 
     @unittest.skipUnless(not CYGWIN, "Mounting not yet supported on Cygwin")
     def test_is_mounted1(self):
         """Test #1: Check if it's detected when a disk is mounted."""
         #If not mounted, mount it
         if not Functions.is_mounted(self.path):
-            self.assertEqual(CoreTools.mount_disk(self.path, "/tmp/ddrescueguimtpt"), 0)
+            self.assertEqual(CoreTools.mount_disk(self.path, MOUNT_POINT), 0)
 
         self.assertTrue(CoreTools.is_mounted(self.path))
 
@@ -185,46 +293,19 @@ class TestIsMounted(unittest.TestCase):
 
         self.assertFalse(CoreTools.is_mounted(self.path))
 
-class TestGetMountPoint(unittest.TestCase):
+class TestGetMountPoint(MountTestCase):
     """Tests for get_mount_point()"""
 
     def setUp(self):
-        self.app = wx.App()
-
-        #Get a device path from the user to test against.
-        global POTENTIAL_PARTITION_PATH
-
-        self.path = POTENTIAL_PARTITION_PATH
-
-        if POTENTIAL_PARTITION_PATH == "":
-            dlg = wx.TextEntryDialog(None, "DDRescue-GUI needs a partition name to test against.\n"
-                                     +"No data on your device will be modified. Suggested: "
-                                     +"insert a USB disk and leave it mounted.\nNote: Do not use "
-                                     +"your device while these tests are running, or it may "
-                                     +"interfere with the tests.", "DDRescue-GUI Tests",
-                                     POTENTIAL_PARTITION_PATH, style=wx.OK)
-
-            dlg.ShowModal()
-            self.path = dlg.GetValue()
-            dlg.Destroy()
-            POTENTIAL_PARTITION_PATH = self.path
-
+        super().setUp()
         self.mount_point = Functions.get_mount_point(self.path)
 
-        #Save it for autocomplete with other dialogs.
-        POTENTIAL_PARTITION_PATH = self.path
-
-    def tearDown(self):
-        self.app.Destroy()
-        del self.app
-        del self.path
-
     @unittest.skipUnless(not CYGWIN, "Mounting not yet supported on Cygwin")
     def test_get_mount_point1(self):
         """Test #1: Get mount point of a mounted disk."""
         #Mount disk if not mounted.
         if not Functions.is_mounted(self.path):
-            Functions.mount_disk(self.path, "/tmp/ddrescueguimtpt")
+            Functions.mount_disk(self.path, MOUNT_POINT)
 
         #Get mount point and verify.
         self.assertEqual(CoreTools.get_mount_point(self.path),
@@ -239,51 +320,25 @@ class TestGetMountPoint(unittest.TestCase):
         #Get mount point.
         self.assertIsNone(CoreTools.get_mount_point(self.path))
 
-class TestMountDisk(unittest.TestCase):
+class TestMountDisk(MountTestCase):
     """Tests for mount_disk()"""
 
     def setUp(self):
-        self.app = wx.App()
-
-        #Get a device path from the user to test against.
-        global POTENTIAL_PARTITION_PATH
-
-        self.path = POTENTIAL_PARTITION_PATH
+        super().setUp()
         self.path2 = ""
 
-        if POTENTIAL_PARTITION_PATH == "":
-            dlg = wx.TextEntryDialog(None, "DDRescue-GUI needs a partition name to test against.\n"
-                                     +"No data on your device will be modified. Suggested: "
-                                     +"insert a USB disk and leave it mounted.\nNote: Do not use "
-                                     +"your device while these tests are running, or it may "
-                                     +"interfere with the tests.", "DDRescue-GUI Tests",
-                                     POTENTIAL_PARTITION_PATH, style=wx.OK)
-
-            dlg.ShowModal()
-            self.path = dlg.GetValue()
-            dlg.Destroy()
-            POTENTIAL_PARTITION_PATH = self.path
-
         self.mount_point = Functions.get_mount_point(self.path)
 
         if self.mount_point is None:
-            self.mount_point = "/tmp/ddrescueguimtpt"
+            self.mount_point = MOUNT_POINT
             os.mkdir(self.mount_point)
 
     def tearDown(self):
-        self.app.Destroy()
-
         #Unmount.
         CoreTools.unmount_disk(self.path)
 
-        del self.app
-        del self.path
-
-        if os.path.isdir("/tmp/ddrescueguimtpt"):
-            if os.path.isdir("/tmp/ddrescueguimtpt/subdir"):
-                os.rmdir("/tmp/ddrescueguimtpt/subdir")
-
-            os.rmdir("/tmp/ddrescueguimtpt")
+        self.remove_mount_point()
+        super().tearDown()
 
     @unittest.skipUnless(not CYGWIN, "Mounting not yet supported on Cygwin")
     def test_mount_disk1(self):
@@ -355,5 +410,8 @@ class TestMountDisk(unittest.TestCase):
         CoreTools.unmount_disk(self.path)
 
         #Clean up.
-        if os.path.isdir(self.mount_point+"/subdir"):
+        try:
             os.rmdir(self.mount_point+"/subdir")
+
+        except FileNotFoundError:
+            pass
@@ -22,13 +22,9 @@ These are the backend tools tests.
 #Import modules
 import unittest
 import os
-import sys
 import wx
 import wx.adv
 
-#Allow imports of modules & packages 1 level up.
-sys.path.insert(0, os.path.abspath('..'))
-
 #Import tools.
 from Tools import mount_tools as MountingTools #pylint: disable=import-error
 
@@ -19,22 +19,34 @@
 Decorators for DDRescue tools
 """
 
+import re
+import sys
+
+VERSION_PATTERN = re.compile(r"\d+\.\d+")
+
+#Every function decorated with define_versions, in the order they were defined.
+REGISTERED_FUNCTIONS = []
+
 def define_versions(function):
     """
     Reads the function docstring to find the ddrescue versions the function
     supports. This is used on all of the tools in the modules in the
     DDRescueTools package.
 
-    This information is saved in the function's SUPPORTEDVERSIONS attribute.
+    This information is saved in the function's SUPPORTEDVERSIONS attribute,
+    as a frozenset so that membership tests are cheap. The function is also
+    added to REGISTERED_FUNCTIONS.
 
     Args:
         function.       The function object that we are creating the attribute
                         for.
     """
 
-    function.SUPPORTEDVERSIONS = []
+    versions = function.__doc__.split("Works with ddrescue versions: ", 1)[1]
+
+    function.SUPPORTEDVERSIONS = frozenset(sys.intern(version) for version
+                                           in VERSION_PATTERN.findall(versions))
 
-    for version in function.__doc__.split("Works with ddrescue versions: ")[1].split(","):
-        function.SUPPORTEDVERSIONS.append(version.replace(" ", "").replace("\n", ""))
+    REGISTERED_FUNCTIONS.append(function)
 
     return function
@@ -33,4 +33,4 @@ def get_outputpos_time_since_last_read(split_line): #pylint: disable=invalid-nam
     Works with ddrescue versions: 1.18,1.19,1.20
     """
 
-    return ' '.join(split_line[1:3]).replace(",", ""), ' '.join(split_line[-3:-1])
+    return (split_line[1]+" "+split_line[2]).replace(",", ""), split_line[-3]+" "+split_line[-2]
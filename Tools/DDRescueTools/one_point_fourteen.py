@@ -19,16 +19,18 @@
 Tools for ddrescue v1.14 or newer.
 """
 
-import sys
-import os
+import bisect
 
 from . import decorators
 
-#Allow imports of modules & packages 1 level up.
-sys.path.insert(0, os.path.abspath('..'))
-
 #Import tools.
-from Tools import core as CoreTools #pylint: disable=import-error
+from .. import core as CoreTools
+
+#Upper bounds (in seconds) for showing the remaining time in seconds, minutes,
+#and hours, and the divisor, number of decimal places, and unit for each
+#bucket above seconds.
+TIME_THRESHOLDS = (60, 3600, 86400)
+TIME_UNITS = ((60, 1, "minutes"), (3600, 2, "hours"), (86400, 2, "days"))
 
 @decorators.define_versions
 def get_inputpos_numerrors_averagereadrate(split_line): #pylint: disable=invalid-name
@@ -42,8 +44,8 @@ def get_inputpos_numerrors_averagereadrate(split_line): #pylint: disable=invalid
     Works with ddrescue versions: 1.14,1.15,1.16,1.17,1.18,1.19,1.20
     """
 
-    return (' '.join(split_line[1:3]).replace(",", ""),
-            split_line[4].replace(",", ""), split_line[7], split_line[8])
+    return ((split_line[1]+" "+split_line[2]).replace(",", ""),
+            split_line[4].rstrip(","), split_line[7], split_line[8])
 
 @decorators.define_versions
 def get_outputpos_time_since_last_read(split_line): #pylint: disable=invalid-name
@@ -59,7 +61,8 @@ def get_outputpos_time_since_last_read(split_line): #pylint: disable=invalid-nam
     #Find the index where "read:" is, and get all useful information after that.
     read_index = split_line.index("read:")
 
-    return (' '.join(split_line[1:3]).replace(",", ""), ' '.join(split_line[read_index+1:]))
+    return ((split_line[1]+" "+split_line[2]).replace(",", ""),
+            ' '.join(split_line[read_index+1:]))
 
 @decorators.define_versions
 def get_current_rate_error_size_recovered_data(split_line): #pylint: disable=invalid-name
@@ -73,7 +76,7 @@ def get_current_rate_error_size_recovered_data(split_line): #pylint: disable=inv
     Works with ddrescue versions: 1.14,1.15,1.16,1.17,1.18,1.19,1.20
     """
 
-    return (' '.join(split_line[7:9]), ' '.join(split_line[3:5]).replace(",", ""),
+    return (split_line[7]+" "+split_line[8], (split_line[3]+" "+split_line[4]).replace(",", ""),
             split_line[0], split_line[1][:2])
 
 @decorators.define_versions
@@ -92,9 +95,8 @@ def get_time_remaining(average_read_rate, average_read_rate_unit, disk_capacity,
     """
 
     #Make sure everything's in the correct units.
-    new_average_read_rate = CoreTools.change_units(float(average_read_rate),
-                                                   average_read_rate_unit,
-                                                   disk_capacity_unit)[0]
+    scale = CoreTools.UNIT_SCALES[average_read_rate_unit[0], disk_capacity_unit[0]]
+    new_average_read_rate = float(average_read_rate) * scale
 
     try:
         #Perform the calculation and round it.
@@ -102,17 +104,13 @@ def get_time_remaining(average_read_rate, average_read_rate_unit, disk_capacity,
 
         #Convert between Seconds, Minutes, Hours, and Days to make the value as
         #understandable as possible.
-        if result <= 60:
-            return str(int(round(result)))+" seconds"
-
-        elif result >= 60 and result <= 3600:
-            return str(round(result/60, 1))+" minutes"
+        bucket = bisect.bisect_left(TIME_THRESHOLDS, result)
 
-        elif result > 3600 and result <= 86400:
-            return str(round(result/3600, 2))+" hours"
+        if not bucket:
+            return f"{round(result)} seconds"
 
-        elif result > 86400:
-            return str(round(result/86400, 2))+" days"
+        divisor, digits, unit = TIME_UNITS[bucket-1]
+        return f"{round(result/divisor, digits)} {unit}"
 
     except ZeroDivisionError:
         pass
@@ -21,6 +21,38 @@ Tools for ddrescue v1.20 or newer.
 
 from . import decorators
 
+#Where "read:" and "remaining" usually are in their split lines, so we can
+#usually avoid searching for them. "remaining" is here in 1.21 and newer, but
+#one word later in 1.20's output position line.
+READ_INDEX = 4
+REMAINING_INDEX = 6
+
+def get_words_after(split_line, word, usual_index, skip):
+    """
+    Get all of the words after the given word in the line, joined by spaces.
+
+    Args:
+        split_line (string):        The line from ddrescue's output that contains
+                                    the information, split by whitespace.
+
+        word (string).              The word to look for.
+        usual_index (int).          Where the word usually is in split_line.
+                                    It's only searched for if it isn't there.
+
+        skip (int).                 How many words to skip after the index
+                                    of the word, eg 1 to skip just the word.
+
+    Returns:
+        string.                     The words after it.
+    """
+
+    index = usual_index
+
+    if len(split_line) <= index or split_line[index] != word:
+        index = split_line.index(word)
+
+    return ' '.join(split_line[index+skip:])
+
 @decorators.define_versions
 def get_time_since_last_read(split_line):
     """
@@ -32,10 +64,8 @@ def get_time_since_last_read(split_line):
 
     Works with ddrescue versions: 1.20,1.21,1.22,1.23,1.24,1.25
     """
-    #Find the index where "read:" is, and get all useful information after that.
-    read_index = split_line.index("read:")
-
-    return ' '.join(split_line[read_index+1:])
+    #Get all useful information after "read:".
+    return get_words_after(split_line, "read:", READ_INDEX, 1)
 
 @decorators.define_versions
 def get_time_remaining(split_line):
@@ -48,7 +78,5 @@ def get_time_remaining(split_line):
 
     Works with ddrescue versions: 1.20,1.21,1.22,1.23,1.24,1.25
     """
-    #Find where "remaining" is in the line, and return all data elements after that.
-    remaining_index = split_line.index("remaining")
-
-    return ' '.join(split_line[remaining_index+2:])
+    #Return all data elements after "remaining time:".
+    return get_words_after(split_line, "remaining", REMAINING_INDEX, 2)
@@ -58,7 +58,7 @@ def get_recovered_data_num_errors(split_line):
 
     Works with ddrescue versions: 1.21
     """
-    return split_line[1], split_line[2][:2], split_line[4].replace(",", "")
+    return split_line[1], split_line[2][:2], split_line[4].rstrip(",")
 
 @decorators.define_versions
 def get_current_rate_inputpos(split_line):
@@ -32,4 +32,4 @@ def get_recovered_data_num_errors(split_line):
 
     Works with ddrescue versions: 1.22,1.23,1.24,1.25
     """
-    return split_line[1], split_line[2][:2], split_line[5].replace(",", "")
+    return split_line[1], split_line[2][:2], split_line[5].rstrip(",")
@@ -21,27 +21,33 @@ the user's version of ddrescue.
 """
 
 #Import modules.
-import types
 import sys
+import functools
 
-#Import tools modules.
-from . import allversions
-from . import one_point_fourteen
-from . import one_point_eighteen
-from . import one_point_twenty
-from . import one_point_twenty_one
-from . import one_point_twenty_two
+#Import tools modules. Importing them registers their functions.
+from . import decorators
+from . import allversions #pylint: disable=unused-import
+from . import one_point_fourteen #pylint: disable=unused-import
+from . import one_point_eighteen #pylint: disable=unused-import
+from . import one_point_twenty #pylint: disable=unused-import
+from . import one_point_twenty_one #pylint: disable=unused-import
+from . import one_point_twenty_two #pylint: disable=unused-import
 
 #Get a list of functions in all of our ddrescue tools modules.
-FUNCTIONS = []
+FUNCTIONS = decorators.REGISTERED_FUNCTIONS
 
-for Module in (allversions, one_point_fourteen, one_point_eighteen, one_point_twenty,
-               one_point_twenty_one, one_point_twenty_two):
+#Index them by the ddrescue versions they support, so we don't have to search
+#through all of them for each version.
+FUNCTIONS_BY_VERSION = {}
 
-    for function in dir(Module):
-        if isinstance(Module.__dict__.get(function), types.FunctionType):
-            FUNCTIONS.append(vars(Module)[function])
+for function in FUNCTIONS:
+    for version in function.SUPPORTEDVERSIONS:
+        FUNCTIONS_BY_VERSION.setdefault(version, []).append(function)
 
+FUNCTIONS_BY_VERSION = {version: tuple(functions)
+                        for version, functions in FUNCTIONS_BY_VERSION.items()}
+
+@functools.lru_cache(maxsize=32)
 def setup_for_ddrescue_version(ddrescue_version):
     """
     Selects and returns a list of the correct functions for our version of
@@ -52,13 +58,18 @@ def setup_for_ddrescue_version(ddrescue_version):
                                             on the system. eg "1.25".
 
     Returns:
-        list.                       A list of all the functions that are designed
-                                    to work with this ddrescue version.
+        tuple.                      All the functions that are designed to work
+                                    with this ddrescue version. The result is
+                                    cached, so it's a tuple to stop callers
+                                    changing it.
 
     """
 
     #Select the best tools if we have an unsupported version of ddrescue.
-    minor_version = int(ddrescue_version.split(".")[1])
+    #NB: Ignore minor revisions eg 1.18.1.
+    major, _, rest = ddrescue_version.partition(".")
+    minor = rest.partition(".")[0]
+    minor_version = int(minor)
 
     if minor_version < 14:
         #Too old.
@@ -69,14 +80,8 @@ def setup_for_ddrescue_version(ddrescue_version):
         best_version = "1.25"
 
     else:
-        #Supported version.
-        #NB: Ignore minor revisions eg 1.18.1.
-        best_version = '.'.join(ddrescue_version.split(".")[0:2])
-
-    suitable_functions = []
-
-    for function in FUNCTIONS: #pylint: disable=redefined-outer-name
-        if best_version in function.SUPPORTEDVERSIONS:
-            suitable_functions.append(function)
+        #Supported version. Intern it like the keys in FUNCTIONS_BY_VERSION, so
+        #the lookup can match by identity.
+        best_version = sys.intern(major+"."+minor)
 
-    return suitable_functions
+    return FUNCTIONS_BY_VERSION[best_version]
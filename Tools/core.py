@@ -30,8 +30,13 @@ import sys
 import subprocess
 import threading
 import shlex
+import shutil
+import re
 import logging
 import time
+import functools
+import hmac
+import secrets
 import wx
 
 #Determine if running on Linux or Mac.
@@ -60,17 +65,94 @@ elif "wxMac" in wx.PlatformInfo:
     CYGWIN = False
     PARTED_MAGIC = False
 
-AUTH_DIALOG_OPEN = False
+#Set whenever the authentication dialog isn't open.
+AUTH_DIALOG_CLOSED = threading.Event()
+AUTH_DIALOG_CLOSED.set()
+
+#How long (in seconds) to wait for the authentication dialog to be closed,
+#before giving up.
+AUTH_DIALOG_TIMEOUT = 300
+
+#Held while a thread is showing, or waiting for, the authentication dialog.
+AUTH_LOCK = threading.Lock()
+
 APPICON = None
+
+#Images used by AuthWindow. See get_image().
+IMAGES = {}
+
 UNIT_LIST = ('null', 'B', 'k', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y')
+
+#Multipliers to convert between units, keyed by the first letters of the
+#current and required units. Saves doing the conversion maths on every update.
+UNIT_SCALES = {(current_unit, required_unit): 10**((current_number - required_number) * 3)
+               for current_number, current_unit in enumerate(UNIT_LIST)
+               for required_number, required_unit in enumerate(UNIT_LIST)}
+
 DISKINFO = {}
 SETTINGS = {}
 LOG_SUFFIX = None
 
+#The environment commands are run with. Only the language is changed, so we can
+#parse the output.
+ENVIRON = dict(os.environ, LC_ALL="C")
+
+#The environment used to run getdevinfo with sudo on macOS. This fixes the import
+#paths, which is necessary because the support for running extra python processes
+#in py2app is poor.
+PYTHON_LIB_PATH = RESOURCEPATH+"/lib/python"+str(sys.version_info[0])+str(sys.version_info[1])
+
+GETDEVINFO_ENVIRON = ["LC_ALL=C", "PYTHONHOME="+RESOURCEPATH,
+                      "PYTHONPATH="+PYTHON_LIB_PATH+".zip:"+PYTHON_LIB_PATH+":"
+                      + PYTHON_LIB_PATH+"/lib-dynload:"+PYTHON_LIB_PATH+"/site-packages.zip:"
+                      + PYTHON_LIB_PATH+"/site-packages"]
+
+#The helper scripts used to run privileged commands on Linux, and patterns that
+#match the commands that need them, in the order they are checked.
+HELPER_PATTERNS = (
+    (re.compile(r"run_getdevinfo\.py"), "runasroot_linux_getdevinfo.sh"),
+    (re.compile(r"umount|kpartx -d|vgchange -a n"), "runasroot_linux_umount.sh"),
+
+    #Note: These are only used in the process of mounting files.
+    (re.compile(r"mount|kpartx -l|kpartx -a|lsblk|partprobe|parted|cryptsetup|file|losetup"
+                r"|pvs|vgchange -a y|lvdisplay"), "runasroot_linux_mount.sh"),
+
+    (re.compile(r"^(?!.*killall).* ddrescue ", re.DOTALL), "runasroot_linux_ddrescue.sh"),
+)
+
+#The ddrescue versions DDRescue-GUI supports.
+SUPPORTED_DDRESCUE_VERSIONS = frozenset(("1.14", "1.15", "1.16", "1.17", "1.18", "1.19", "1.20",
+                                         "1.21", "1.22", "1.23", "1.24", "1.25"))
+
+#Matches a ddrescue version, eg 1.19.5-rc1. The 1st group is the major and
+#minor version, and the 2nd group is set for -rc and -pre versions.
+DDRESCUE_VERSION_PATTERN = re.compile(r"(\d+\.\d+)[^-]*(-rc|-pre)?")
+
+#Matches the octal escapes used in /proc/self/mountinfo.
+MOUNT_PATH_ESCAPE = re.compile(r"\\([0-7]{3})")
+
 #Set up logging.
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.getLogger("DDRescue-GUI").getEffectiveLevel())
 
+def get_image(name, loader):
+    """
+    Get one of the images used by AuthWindow. They are loaded the first time
+    they are needed, and then reused every time the window is opened.
+
+    Args:
+        name (string).          The name of the image.
+        loader (function).      Loads the image. Only called the first time.
+
+    Returns:
+        The image.
+    """
+
+    if name not in IMAGES:
+        IMAGES[name] = loader()
+
+    return IMAGES[name]
+
 #Begin Mac Authentication Window.
 class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instance-attributes
     """
@@ -92,7 +174,8 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
 
         #Set the frame's icon.
         global APPICON
-        APPICON = wx.Icon(RESOURCEPATH+"/images/Logo.png", wx.BITMAP_TYPE_PNG)
+        APPICON = get_image("Icon", lambda: wx.Icon(RESOURCEPATH+"/images/Logo.png",
+                                                    wx.BITMAP_TYPE_PNG))
         wx.Frame.SetIcon(self, APPICON)
 
         self.create_text()
@@ -134,8 +217,10 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         Create all other widgets for AuthenticationWindow
         """
         #Create the image.
-        img = wx.Image(RESOURCEPATH+"/images/Logo.png", wx.BITMAP_TYPE_PNG)
-        self.program_logo = wx.StaticBitmap(self.panel, -1, wx.Bitmap(img))
+        logo = get_image("Logo", lambda: wx.Bitmap(wx.Image(RESOURCEPATH+"/images/Logo.png",
+                                                            wx.BITMAP_TYPE_PNG)))
+
+        self.program_logo = wx.StaticBitmap(self.panel, -1, logo)
 
         #Create the password field.
         self.password_field = wx.TextCtrl(self.panel, -1, "",
@@ -144,13 +229,21 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         self.password_field.SetBackgroundColour((255, 255, 255))
 
         #Create the throbber.
-        self.busy = wx.adv.Animation(RESOURCEPATH+"/images/Throbber.gif")
-        self.green_pulse = wx.adv.Animation(RESOURCEPATH+"/images/GreenPulse.gif")
-        self.red_pulse = wx.adv.Animation(RESOURCEPATH+"/images/RedPulse.gif")
+        self.busy = get_image("Throbber",
+                              lambda: wx.adv.Animation(RESOURCEPATH+"/images/Throbber.gif"))
+
+        self.green_pulse = get_image("GreenPulse",
+                                     lambda: wx.adv.Animation(RESOURCEPATH
+                                                              + "/images/GreenPulse.gif"))
+
+        self.red_pulse = get_image("RedPulse",
+                                   lambda: wx.adv.Animation(RESOURCEPATH+"/images/RedPulse.gif"))
 
         self.throbber = wx.adv.AnimationCtrl(self.panel, -1, self.green_pulse)
-        self.throbber.SetInactiveBitmap(wx.Bitmap(RESOURCEPATH+"/images/ThrobberRest.png",
-                                                  wx.BITMAP_TYPE_PNG))
+        self.throbber.SetInactiveBitmap(get_image("ThrobberRest",
+                                                  lambda: wx.Bitmap(RESOURCEPATH
+                                                                    + "/images/ThrobberRest.png",
+                                                                    wx.BITMAP_TYPE_PNG)))
 
         self.throbber.SetClientSize(wx.Size(30, 30))
 
@@ -222,27 +315,46 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         #Disable the auth button (stops you from trying twice in quick succession).
         self.auth_button.Disable()
 
-        #Check the password is right.
         password = self.password_field.GetLineText(0)
-        cmd = subprocess.Popen("LC_ALL=C sudo -S echo 'Authentication Succeeded'",
+
+        self.throbber.SetAnimation(self.busy)
+        self.throbber.Play()
+
+        #Check the password in another thread, so the throbber keeps playing.
+        threading.Thread(target=self.check_password, args=(password,)).start()
+
+    def check_password(self, password):
+        """
+        Check the password is correct, and tell the GUI thread the result.
+        Called in a separate thread by on_auth_attempt().
+
+        Args:
+            password (string).      The password the user entered.
+        """
+
+        #Have sudo print a random token, so we know the output came from the command.
+        token = secrets.token_hex(16)
+
+        cmd = subprocess.Popen(["sudo", "-S", "printf", "%s", token],
                                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE, shell=True)
+                               stderr=subprocess.PIPE, env=ENVIRON)
 
         #Send the password to sudo through stdin,
         #to avoid showing the user's password in the system/activity monitor.
-        cmd.stdin.write(password.encode()+b"\n")
-        cmd.stdin.close()
+        output = cmd.communicate(input=password.encode()+b"\n")[0].decode("utf-8")
 
-        self.throbber.SetAnimation(self.busy)
-        self.throbber.Play()
+        wx.CallAfter(self.on_auth_result, hmac.compare_digest(output.strip(), token))
 
-        while cmd.poll() is None:
-            #wx.GetApp().Yield()
-            time.sleep(0.04)
+    def on_auth_result(self, succeeded):
+        """
+        Show the user whether authentication succeeded. If so, exit. If not,
+        let the user try again.
 
-        output = cmd.stdout.read().decode("utf-8")
+        Args:
+            succeeded (bool).       Whether the password was correct.
+        """
 
-        if "Authentication Succeeded" in output:
+        if succeeded:
             #Set the password field colour to green and disable the cancel button.
             self.password_field.SetBackgroundColour((192, 255, 192))
             self.password_field.SetValue("ABCDEFGHIJKLMNOPQRSTUVWXYZ123456789!£$%^&*()_+")
@@ -259,19 +371,7 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
 
             #Shake the window
             x_pos, y_pos = self.GetPosition()
-            count = 0
-
-            while count <= 6:
-                if count % 2 == 0:
-                    x_pos -= 10
-
-                else:
-                    x_pos += 10
-
-                time.sleep(0.02)
-                self.SetPosition((x_pos, y_pos))
-                #wx.GetApp().Yield()
-                count += 1
+            wx.CallLater(20, self.shake_window, 0, x_pos, y_pos)
 
             #Set the password field colour to pink, and select its text.
             self.password_field.SetBackgroundColour((255, 192, 192))
@@ -283,6 +383,29 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
             self.throbber.Play()
             wx.CallLater(1000, self.throbber.Stop)
 
+    def shake_window(self, count, x_pos, y_pos):
+        """
+        Move the window one step while shaking it, and schedule the next step,
+        so the window is redrawn in between.
+
+        Args:
+            count (int).            The number of steps done so far.
+            x_pos (int).            The window's current x position.
+            y_pos (int).            The window's current y position.
+        """
+
+        if count > 6:
+            return
+
+        if count % 2 == 0:
+            x_pos -= 10
+
+        else:
+            x_pos += 10
+
+        self.SetPosition((x_pos, y_pos))
+        wx.CallLater(20, self.shake_window, count+1, x_pos, y_pos)
+
     def test_auth(): #pylint: disable=no-method-argument
         """
         Check if we have cached authentication.
@@ -292,21 +415,13 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
                             False = We don't.
         """
 
-        #Check the password is right.
-        cmd = subprocess.Popen("LC_ALL=C sudo -S echo 'Authentication Succeeded'",
-                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE, shell=True)
-
-        #Send the password to sudo through stdin,
-        #to avoid showing the user's password in the system/activity monitor.
-        cmd.stdin.close()
-
-        while cmd.poll() is None:
-            time.sleep(0.04)
+        #Run a command that does nothing. -n stops sudo from asking for a
+        #password, so this fails straight away if there are no cached credentials.
+        cmd = subprocess.run(["sudo", "-n", "true"], stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                             env=ENVIRON, check=False)
 
-        output = cmd.stdout.read().decode("utf-8")
-
-        return "Authentication Succeeded" in output
+        return cmd.returncode == 0
 
     def run(): #pylint: disable=no-method-argument
         """
@@ -314,74 +429,126 @@ class AuthWindow(wx.Frame): #pylint: disable=too-many-ancestors,too-many-instanc
         pre-authenticated, just return immediately.
         """
 
-        global AUTH_DIALOG_OPEN
+        dialog_shown = False
 
-        #Use cached credentials rather than open the auth window if possible.
-        if AuthWindow.test_auth():
-            AUTH_DIALOG_OPEN = False
-            return
+        try:
+            #Use cached credentials rather than open the auth window if possible.
+            if not AuthWindow.test_auth():
+                AUTH_DIALOG_CLOSED.clear()
 
-        AUTH_DIALOG_OPEN = True
+                AuthWindow().Show()
+                dialog_shown = True
 
-        AuthWindow().Show()
+        finally:
+            #Don't leave anything waiting for a dialog that isn't open.
+            if not dialog_shown:
+                AUTH_DIALOG_CLOSED.set()
 
     def on_exit(self, event=None): #pylint: disable=unused-argument
         """
         Close AuthWindow() and exit
         """
-        global AUTH_DIALOG_OPEN
-        AUTH_DIALOG_OPEN = False
-
         self.Destroy()
 
+        AUTH_DIALOG_CLOSED.set()
+
 #End Mac Authentication Window.
 
-def get_helper(cmd):
+def pre_authenticate():
     """
-    Figure out which helper script to use for this command.
+    Pre-authenticate with the auth dialog on macOS, and return when it has
+    been closed. If we are already pre-authenticated, return immediately.
 
-    Args:
-        cmd (string).           The command(s) about to be run.
+    Only one thread shows the dialog at a time. Any others wait for it to
+    close, and then find the cached credentials rather than opening another
+    dialog.
 
     Returns:
-        string.                 "pkexec" + <the helper script needed>
-                                + the command(s) to run.
+        bool.           True = The dialog was closed, or wasn't needed.
+                        False = We gave up waiting for the dialog.
     """
 
-    #Permissions don't work this way in Cygwin.
-    if CYGWIN:
-        return ""
+    if threading.current_thread() == threading.main_thread():
+        deadline = time.monotonic() + AUTH_DIALOG_TIMEOUT
 
-    helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux.sh"
+        #Don't block the event loop while another thread's dialog is open.
+        while not AUTH_LOCK.acquire(timeout=0.04):
+            if time.monotonic() > deadline:
+                logger.error("pre_authenticate(): Timed out waiting for another "
+                             "thread's authentication dialog to close!")
+                return False
 
-    if "run_getdevinfo.py" in cmd:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_getdevinfo.sh"
+            wx.GetApp().Yield()
 
-    elif "umount" in cmd or "kpartx -d" in cmd or "vgchange -a n" in cmd:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_umount.sh"
+        try:
+            AuthWindow.run()
 
-    elif ("mount" in cmd or "kpartx -l" in cmd or "kpartx -a" in cmd or "lsblk" in cmd
-          or "partprobe" in cmd or "parted" in cmd or "cryptsetup" in cmd
-          or "file" in cmd or "losetup" in cmd or "pvs" in cmd
-          or "vgchange -a y" in cmd or "lvdisplay" in cmd):
+            #Make sure the throbber plays properly and the window is responsive.
+            while not AUTH_DIALOG_CLOSED.is_set():
+                if time.monotonic() > deadline:
+                    logger.error("pre_authenticate(): Timed out waiting for the "
+                                 "authentication dialog to close!")
+                    return False
 
-        #Note: These are only used in the process of mounting files.
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_mount.sh"
+                wx.GetApp().Yield()
+                AUTH_DIALOG_CLOSED.wait(0.04)
 
-    elif " ddrescue " in cmd and "killall" not in cmd:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux_ddrescue.sh"
+        finally:
+            AUTH_LOCK.release()
 
     else:
-        helper = "/usr/share/ddrescue-gui/Tools/helpers/runasroot_linux.sh"
+        #The lock is released when we return, even if we time out, so one lost
+        #dialog doesn't stop every later privileged command.
+        with AUTH_LOCK:
+            #Prevent a race condition.
+            AUTH_DIALOG_CLOSED.clear()
+
+            wx.CallAfter(AuthWindow.run)
+
+            #Wait until the dialog has been closed.
+            if not AUTH_DIALOG_CLOSED.wait(AUTH_DIALOG_TIMEOUT):
+                logger.error("pre_authenticate(): Timed out waiting for the "
+                             "authentication dialog to close!")
+                return False
+
+    return True
+
+@functools.lru_cache(maxsize=256)
+def get_helper(cmd):
+    """
+    Figure out which helper script to use for this command.
 
-    return "pkexec "+helper
+    Args:
+        cmd (string).           The command(s) about to be run.
+
+    Returns:
+        tuple.                  "pkexec" and the path to the helper script
+                                needed, to go in front of the command's
+                                arguments.
+    """
+
+    #Permissions don't work this way in Cygwin.
+    if CYGWIN:
+        return ()
+
+    helper = "runasroot_linux.sh"
+
+    #Use the first helper script that matches.
+    for pattern, helper_script in HELPER_PATTERNS:
+        if pattern.search(cmd):
+            helper = helper_script
+            break
+
+    return ("pkexec", "/usr/share/ddrescue-gui/Tools/helpers/"+helper)
 
 def start_process(cmd, return_output=False, privileged=False):
     """
     Start a given process, and return the output and return value if needed.
 
     Args:
-        cmd (string).               The command(s) to run.
+        cmd (string or list).       The command(s) to run. A list of
+                                    arguments is used as-is, rather than
+                                    being split up like a string is.
 
     Kwargs:
         return_output[=False]       Whether to return the output or not. If not
@@ -402,81 +569,65 @@ def start_process(cmd, return_output=False, privileged=False):
                                 newline characters.
 
     """
-    #Save the command as it was passed, in case we need
-    #to call recursively (pkexec auth failure/dismissal).
-    origcmd = cmd
+    #Split the command once. Anything else we need to run it is added to the front
+    #of the list.
+    if isinstance(cmd, str):
+        argv = shlex.split(cmd)
+
+    else:
+        argv = list(cmd)
+        cmd = ' '.join(cmd)
 
     #If this is to be a privileged process, add the helper script to the cmdline.
     if privileged:
         if LINUX:
-            helper = get_helper(cmd)
-
-            cmd = helper+" "+cmd
+            argv = [*get_helper(cmd), *argv]
 
         else:
-            #Pre-authenticate with the auth dialog. Not py2 compatible, but only used
-            #on OS X builds, which are py3-only anyway.
-            if threading.current_thread() == threading.main_thread():
-                AuthWindow.run()
-
-            else:
-                wx.CallAfter(AuthWindow.run)
-
-                #Prevent a race condition.
-                global AUTH_DIALOG_OPEN
-                AUTH_DIALOG_OPEN = True
-
-            #Make sure the throbber plays properly and the window is responsive.
-            while AUTH_DIALOG_OPEN:
-                wx.GetApp().Yield()
-                time.sleep(0.04)
-
             #Set up the environemt here - sudo will clear it if we do it the
-            #wrong way.
+            #wrong way. The variables are passed as separate arguments, so
+            #they don't need quoting.
             if "/Tools/run_getdevinfo.py" in cmd:
                 #Fix import paths on macOS.
-                #This is necessary because the support for running extra python processes
-                #in py2app is poor.
-                major = sys.version_info[0]
-                minor = sys.version_info[1]
-
-                environ = 'LC_ALL="C" PYTHONHOME="'+RESOURCEPATH+'" PYTHONPATH="' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'.zip:' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+':' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'/lib-dynload:' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'/site-packages.zip:' \
-                          + RESOURCEPATH+'/lib/python'+str(major)+str(minor)+'/site-packages" '
+                environ = GETDEVINFO_ENVIRON
 
             else:
-                environ = 'LC_ALL="C" '
+                environ = ["LC_ALL=C"]
 
-            cmd = "sudo -SH "+environ+cmd
+            argv = ["sudo", "-SH"]+environ+argv
 
-    environ = dict(os.environ, LC_ALL="C")
+    #Keep trying if authentication is dismissed, or the wrong password is entered 3 times.
+    while True:
+        if privileged and not LINUX and not pre_authenticate():
+            #We couldn't authenticate, so don't run the command.
+            logger.error("start_process(): Couldn't authenticate. Not running: "
+                         +' '.join(argv))
+
+            retval = 126
+            output = []
+            break
 
-    cmd = shlex.split(cmd)
+        logger.debug("start_process(): Starting process: "+' '.join(argv))
 
-    logger.debug("start_process(): Starting process: "+' '.join(cmd))
+        runcmd = subprocess.Popen(argv, stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, env=ENVIRON,
+                                  shell=False)
 
-    runcmd = subprocess.Popen(cmd, stdout=subprocess.PIPE,
-                              stderr=subprocess.STDOUT, env=environ,
-                              shell=False)
+        #Save the output, and runcmd.returncode. read() waits for the command
+        #to exit, so the return code is always set. Handle unicode properly.
+        output = read(runcmd)
 
-    #Save the output, and runcmd.returncode,
-    #as they tend to reset fairly quickly. Handle unicode properly.
-    output = read(runcmd)
+        retval = int(runcmd.returncode)
 
-    retval = int(runcmd.returncode)
+        #Log this info in a debug message.
+        logger.debug("start_process(): Process: "+' '.join(argv)+": Return Value: "
+                     +str(retval)+", output: \"\n\n"+'\n'.join(output)+"\"\n")
 
-    #Log this info in a debug message.
-    logger.debug("start_process(): Process: "+' '.join(cmd)+": Return Value: "
-                 +str(retval)+", output: \"\n\n"+'\n'.join(output)+"\"\n")
+        if not (privileged and retval in (126, 127)):
+            break
 
-    if privileged and (retval == 126 or retval == 127):
         #Try again, auth dismissed / bad password 3 times.
-        #A lot of recursion is allowed (~1000 times), so this shouldn't be a problem.
         logger.debug("start_process(): Bad auth or dismissed by user. Trying again...")
-        return start_process(cmd=origcmd, return_output=return_output, privileged=privileged)
 
     if not return_output:
         #Return the return code back to whichever function ran this process, so it handles errors.
@@ -488,8 +639,8 @@ def start_process(cmd, return_output=False, privileged=False):
 
 def read(cmd, testing=False):
     """
-    Read the cmd's output character by character. Also make sure everything is
-    converted to unicode. Break lines by the newline and
+    Read all of the cmd's output, and wait for it to exit. Also make sure
+    everything is converted to unicode. Break lines by the newline and
     (carriage return) characters. Also handle null characters by
     removing them from the output.
 
@@ -507,68 +658,48 @@ def read(cmd, testing=False):
 
     """
 
-    #Get ready to run the command(s).
-    #Read up to 100 empty "" characters after the process finishes to
-    #make sure we get all the output.
-    counter = 0
-    line = bytes(b"")
-    line_list = []
-
-    while cmd.poll() is None or counter < 100:
-        char = cmd.stdout.read(1)
-
-        if char == b"":
-            counter += 1
-            continue
-
-        line += char
-
-        if char in (b"\n", b"\r"):
-            #Interpret as Unicode and remove "NULL" characters.
-            line = line.decode("UTF-8", errors="ignore").replace("\x00", "")
+    #Read everything in one go, rather than a character at a time. This returns
+    #when the command closes its output, and then we wait for it to exit so its
+    #return code is set.
+    output = cmd.stdout.read()
+    cmd.wait()
 
-            if testing:
-                line_list.append(line)
+    #Remove "NULL" characters and interpret as Unicode.
+    output = output.translate(None, b"\x00").decode("UTF-8", errors="ignore")
 
-            else:
-                line_list.append(line.replace("\n", "").replace("\r", ""))
-
-            #Reset line.
-            line = bytes(b"")
-
-    #Catch it if there's not a newline at the end.
-    if line != b"":
-        #Interpret as Unicode and remove "NULL" characters.
-        line = line.decode("UTF-8", errors="ignore").replace("\x00", "")
+    #Break lines at every newline and carriage return character. Keep them
+    #at the end of each line if we're testing.
+    if testing:
+        line_list = re.split("(?<=[\n\r])", output)
 
-        if testing:
-            line_list.append(line)
+    else:
+        line_list = re.split("[\n\r]", output)
 
-        else:
-            line_list.append(line.replace("\n", "").replace("\r", ""))
+    #Catch it if there's a newline at the end.
+    if line_list[-1] == "":
+        line_list.pop()
 
     return line_list
 
 def find_ddrescue():
     """
     Attempts to find GNU ddrescue, and ends the program if it couldn't be found.
+
+    Returns:
+        string.         The path to ddrescue.
     """
 
-    #Define places we need to look for ddrescue.
+    #Look for ddrescue in the PATH, or (for macOS) where it is bundled with the GUI.
     if LINUX:
-        paths = os.getenv("PATH").split(":")
+        ddrescue_path = shutil.which("ddrescue")
 
-    else:
-        paths = [RESOURCEPATH]
+    elif os.path.isfile(RESOURCEPATH+"/ddrescue"):
+        ddrescue_path = RESOURCEPATH+"/ddrescue"
 
-    found_ddrescue = False
-
-    for path in paths:
-        if os.path.isfile(path+"/ddrescue"):
-            #Yay!
-            found_ddrescue = True
+    else:
+        ddrescue_path = None
 
-    if not found_ddrescue:
+    if ddrescue_path is None:
         dlg = wx.MessageDialog(None, "Couldn't find ddrescue! Are you sure it is "
                                "installed on your system? If you're on a "
                                "mac, this indicates an issue with the "
@@ -579,6 +710,9 @@ def find_ddrescue():
         dlg.Destroy()
         sys.exit("\nCouldn't find ddrescue!")
 
+    return ddrescue_path
+
+@functools.lru_cache(maxsize=1)
 def determine_ddrescue_version():
     """
     Used to determine the version of ddrescue installed on the system,
@@ -588,6 +722,9 @@ def determine_ddrescue_version():
     from the version string and warning the user (not doing so would
     cause errors in other parts of DDRescue-GUI).
 
+    The result is cached, so ddrescue is only run (and the user only
+    warned) the first time this is called.
+
     Returns:
         string.         The ddrescue version present on the system.
     """
@@ -597,10 +734,10 @@ def determine_ddrescue_version():
 
     #Use correct command.
     if LINUX:
-        cmd = "ddrescue --version"
+        cmd = ["ddrescue", "--version"]
 
     else:
-        cmd = RESOURCEPATH+"/ddrescue --version"
+        cmd = [RESOURCEPATH+"/ddrescue", "--version"]
 
     ddrescue_version = \
     start_process(cmd=cmd, return_output=True)[1].split("\n")[0].split(" ")[-1]
@@ -609,22 +746,16 @@ def determine_ddrescue_version():
 
     #Remove the -rc and -pre flags if they exist.
     #But note if we are running a prerelease version so we can warn the user.
+    #Also ignore any minor changes. eg: treat 1.19.5 as 1.19.
+    match = DDRESCUE_VERSION_PATTERN.match(ddrescue_version)
     prerelease = False
 
-    if "-rc" in ddrescue_version:
-        prerelease = True
-        ddrescue_version = ddrescue_version.split("-rc")[0]
-
-    elif "-pre" in ddrescue_version:
-        prerelease = True
-        ddrescue_version = ddrescue_version.split("-pre")[0]
-
-    #Ignore any monitor changes. eg: treat 1.19.5 as 1.19 - strip anything after that off.
-    ddrescue_version = '.'.join(ddrescue_version.split(".")[:2])
+    if match is not None:
+        ddrescue_version = match.group(1)
+        prerelease = (match.group(2) is not None)
 
     #Warn if not on a supported version.
-    if ddrescue_version not in ("1.14", "1.15", "1.16", "1.17", "1.18", "1.18.1", "1.19", "1.20",
-                                "1.21", "1.22", "1.23", "1.24", "1.25"):
+    if ddrescue_version not in SUPPORTED_DDRESCUE_VERSIONS:
         logger.warning("Unsupported ddrescue version "+ddrescue_version+"! "
                        "Please upgrade DDRescue-GUI if possible.")
 
@@ -661,9 +792,9 @@ def create_unique_key(dictionary, data, length):
     """
     Create a unique dictionary key.
 
-    The unique key is created by adding a number on the the end of the given data,
-    while keeping it at the correct length. The key will also start with '...'
-    if the data was longer than the specified length.
+    The unique key is created by replacing the end of the given data with "~" and
+    a number, while keeping it at the correct length. The key will also start
+    with '...' if the data was longer than the specified length.
 
     Args:
         dictionary (dict).              The dictionary that the key will be stored
@@ -679,40 +810,26 @@ def create_unique_key(dictionary, data, length):
         string.                         The unique key.
     """
 
-    #Only add numbers to the key if needed.
-    if "..."+data[-length:] in dictionary.keys():
-        #digit to add to the end of the key.
-        digit = 0
-        key = data
-
-        while True:
-            #Add a digit to the end of the key to get a new key, repeat until the key is unique.
-            digit_length = len(str(digit))
+    #Start the key with '...' if the data had to be shortened to fit.
+    if len(data) >= length:
+        prefix = "..."
 
-            if key[-digit_length:] == digit and key[-digit_length-1] == "~":
-                #Remove the old non-unique digit and underscore at the end.
-                key = key[0:-digit_length-1]
-
-            #Add 1 to the digit.
-            digit += 1
+    else:
+        prefix = ""
 
-            key = key+str(digit)
-            key = key[-length:]
+    key = data[-length:]
+    unique_key = prefix+key
 
-            if "..."+key not in dictionary.keys():
-                #Yay! Unique!
-                key = "..."+key
-                break
+    #Replace the end of the key with "~" and a number, counting up until the key is
+    #unique.
+    digit = 1
 
-    else:
-        key = data[-length:]
-        key = "..."+key
+    while unique_key in dictionary:
+        digit += 1
+        suffix = "~"+str(digit)
+        unique_key = prefix+key[:length-len(suffix)]+suffix
 
-    #Remove '...' if key is shorter than length+3 chars (to account for...).
-    if len(key) < length+3:
-        key = key[3:]
-
-    return key
+    return unique_key
 
 def send_notification(msg):
     """
@@ -722,16 +839,19 @@ def send_notification(msg):
         msg (string).               The message to display in the notification.
 
     """
+    #Quote the message, so quotes in it can't break up the command.
+    msg = shlex.quote(msg)
+
     if LINUX:
         #Use notify-send.
-        start_process(cmd="notify-send 'DDRescue-GUI' '"+msg
-                      +"' -i /usr/share/pixmaps/ddrescue-gui.png", return_output=False)
+        start_process(cmd="notify-send 'DDRescue-GUI' "+msg
+                      +" -i /usr/share/pixmaps/ddrescue-gui.png", return_output=False)
 
     else:
         #Use Terminal-notifier.
         start_process(cmd=RESOURCEPATH
                       +"""/other/terminal-notifier.app/Contents/MacOS/terminal-notifier """ \
-                      +"""-title "DDRescue-GUI" -message \""""+msg+"""\" """ \
+                      +"""-title "DDRescue-GUI" -message """+msg+""" """ \
                       +"""-sender org.pythonmac.unspecified.DDRescue-GUI """ \
                       +"""-group \"DDRescue-GUI\"""",
                       return_output=False)
@@ -753,16 +873,58 @@ def change_units(number_to_change, current_unit, required_unit):
             1st element:                The number's value in its new unit.
             2nd element:                The new unit.
     """
-    #Prepare for the change.
-    old_unit_number = UNIT_LIST.index(current_unit[0])
-    required_unit_number = UNIT_LIST.index(required_unit[0])
-    change_in_unit_number = required_unit_number - old_unit_number
-    power = -change_in_unit_number * 3
+    return number_to_change * UNIT_SCALES[current_unit[0], required_unit[0]], required_unit[:2]
 
-    #Do it.
-    return number_to_change * 10**power, required_unit[:2]
+def unescape_mount_path(path):
+    """
+    Replace the octal escapes the kernel uses for spaces, tabs, newlines, and
+    backslashes in /proc/self/mountinfo with the characters themselves.
+
+    Args:
+        path (string).          The path from /proc/self/mountinfo.
+
+    Returns:
+        string.                 The path without escapes.
+    """
+
+    return MOUNT_PATH_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), path)
 
-def is_mounted(partition, mount_point=None):
+def get_mounts():
+    """
+    Get the devices that are mounted, and where they are mounted.
+
+    Returns:
+        list.                   A list of (device, mount point) tuples.
+    """
+
+    mounts = []
+
+    if LINUX:
+        #Read the kernel's mount table, rather than running mount. The mount
+        #point is the 5th field, and the device is the 2nd field after the "-".
+        with open("/proc/self/mountinfo") as mount_table:
+            for line in mount_table:
+                fields, rest = line.split(" - ")
+                mount_point = fields.split(None, 5)[4]
+                device = rest.split(None, 2)[1]
+
+                mounts.append((unescape_mount_path(device), unescape_mount_path(mount_point)))
+
+        return mounts
+
+    mount_info = start_process(["mount"], return_output=True)[1]
+
+    #Lines look like "<device> on <mount point> (<options>)". We only need the
+    #first 3 words.
+    for line in mount_info.splitlines():
+        split_line = line.split(None, 3)
+
+        if len(split_line) >= 3:
+            mounts.append((split_line[0], split_line[2]))
+
+    return mounts
+
+def is_mounted(partition, mount_point=None, mounts=None):
     """
     Checks if the given partition is mounted.
 
@@ -775,6 +937,10 @@ def is_mounted(partition, mount_point=None):
                                             Otherwise, just check that it is
                                             mounted somewhere.
 
+        mounts[=None] (list).               The output of get_mounts(), if the
+                                            caller already has it. If not
+                                            specified, get_mounts() is called.
+
     Returns:
         bool.
 
@@ -783,48 +949,44 @@ def is_mounted(partition, mount_point=None):
 
     """
 
+    if mounts is None:
+        mounts = get_mounts()
+
     if mount_point is None:
         logger.debug("is_mounted(): Checking if "+partition+" is mounted...")
-        mount_info = start_process("mount", return_output=True)[1]
-
-        disk_is_mounted = False
 
         #OS X fix: Handle paths with /tmp in them, as paths with /private/tmp.
         if not LINUX and "/tmp" in partition:
             partition = partition.replace("/tmp", "/private/tmp")
 
         #LINUX fix: Accept any mountpoint when called with just one argument.
-        for line in mount_info.split("\n"):
-            if line and line.split(" on ")[0] == partition \
-                or line.split(" ")[2] == partition \
-                or line.split(" on ")[1].split(" type ")[0] == partition:
-
-                disk_is_mounted = True
-                break
+        disk_is_mounted = any(partition in mount for mount in mounts)
 
     else:
         #Check where it's mounted at.
         logger.debug("is_mounted(): Checking if "+partition+" is mounted at "+mount_point+"...")
 
-        disk_is_mounted = False
-
         #OS X fix: Handle paths with /tmp in them, as paths with /private/tmp.
         if not LINUX and "/tmp" in mount_point:
             mount_point = mount_point.replace("/tmp", "/private/tmp")
 
-        if get_mount_point(partition) == mount_point:
-            disk_is_mounted = True
+        disk_is_mounted = (get_mount_point(partition, mounts) == mount_point)
 
     logger.debug("is_mounted(): Disk is mounted: "+str(disk_is_mounted))
     return disk_is_mounted
 
-def get_mount_point(partition):
+def get_mount_point(partition, mounts=None):
     """
     Returns the mountpoint of the given partition, if any.
 
     Args:
         partition (string).             The partition to find the mount point of.
 
+    Kwargs:
+        mounts[=None] (list).           The output of get_mounts(), if the
+                                        caller already has it. If not
+                                        specified, get_mounts() is called.
+
     Returns:
         Multiple types.
 
@@ -837,16 +999,10 @@ def get_mount_point(partition):
 
     logger.info("get_mount_point(): Trying to get mount point of partition "+partition+"...")
 
-    mount_info = start_process("mount", return_output=True)[1]
-    mount_point = None
-
-    for line in mount_info.split("\n"):
-        split_line = line.split()
+    if mounts is None:
+        mounts = get_mounts()
 
-        if split_line:
-            if partition == split_line[0]:
-                mount_point = split_line[2]
-                break
+    mount_point = next((point for device, point in mounts if device == partition), None)
 
     if mount_point != None:
         logger.info("get_mount_point(): Found it! mount_point is "+mount_point+"...")
@@ -891,16 +1047,17 @@ def mount_disk(partition, mount_point, options=""):
         logger.info("mount_disk(): Preparing to mount "+partition+" at "+mount_point
                     +" with no extra options...")
 
-    mount_info = start_process("mount", return_output=True)[1]
+    #Only check the mount table once.
+    mounts = get_mounts()
 
     #There is a partition mounted here. Check if it's ours.
-    if mount_point == get_mount_point(partition):
+    if mount_point == get_mount_point(partition, mounts):
         #The correct partition is already mounted here.
         logger.debug("mount_disk(): partition: "+partition+" was already mounted at: "
                      +mount_point+". Continuing...")
         return 0
 
-    elif mount_point in mount_info:
+    elif mount_point in (point for device, point in mounts):
         #Something else is in the way. Unmount that partition, and continue.
         logger.warning("mount_disk(): Unmounting filesystem in the way at "+mount_point+"...")
         if unmount_disk(mount_point) != 0:
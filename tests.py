@@ -28,10 +28,6 @@ import getopt
 import sys
 import wx
 
-#Make unicode an alias for str in Python 3.
-if sys.version_info[0] == 3:
-    unicode = str #pylint: disable=redefined-builtin,invalid-name
-
 #Global vars.
 VERSION = "2.1.1"
 